@@ -337,20 +337,18 @@ class EosType(EosTemplate):
 
         return max_density
 
-    def update_parameter(self, param_name, bead_names, param_value):
+    def _check_parameter(self, param_name, bead_names):
         r"""
-        Update a single parameter value during parameter fitting process.
+        Check that a parameter may be updated with ``update_parameter``, including that ai and bi aren't updated for beads initialized with critical properties.
 
-        To refresh those parameters that are dependent on to bead_library or cross_library, use method "parameter refresh".
+        To refresh those parameters that are dependent on to bead_library or cross_library after an update, use method "parameter refresh".
         
         Parameters
         ----------
         param_name : str
             Parameter to be fit. See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. kij_CO2).
-        bead_names : list
+        bead_names : list or tuple
             Bead names to be changed. For a self interaction parameter, the length will be 1, for a cross interaction parameter, the length will be two.
-        param_value : float
-            Value of parameter
         """
 
         if (
@@ -362,7 +360,7 @@ class EosType(EosTemplate):
                     bead_names[0]
                 )
             )
-        super().update_parameter(param_name, bead_names, param_value)
+        super()._check_parameter(param_name, bead_names)
 
     def parameter_refresh(self):
         r""" 
@@ -78,7 +78,7 @@ def partial_density_central_difference(
                 for j, delta in enumerate((dy, -dy)):
                     y_temp = np.copy(y)
                     y_temp[i] += delta
-                    Ares[j] = _partial_density_wrapper(np.exp(y_temp), T, func)
+                    Ares[j] = np.ravel(_partial_density_wrapper(np.exp(y_temp), T, func))[0]
                 dAdrho[i] = (Ares[0] - Ares[1]) / (2.0 * dy) / np.exp(y[i])
             else:
                 dAdrho[i] = np.finfo(float).eps
@@ -94,7 +94,7 @@ def partial_density_central_difference(
                     y_temp = np.copy(y)
                     if y_temp[i] != 0.0:
                         y_temp[i] += delta
-                    Ares[j] = _partial_density_wrapper(y_temp, T, func)
+                    Ares[j] = np.ravel(_partial_density_wrapper(y_temp, T, func))[0]
                 dAdrho[i] = (Ares[0] - Ares[1]) / (2.0 * dy)
             else:
                 dAdrho[i] = np.finfo(float).eps
@@ -67,6 +67,9 @@ class EosTemplate(ABC):
         self.bead_library = None
         self.cross_library = None
 
+        # Parameters and beads already checked by update_parameters
+        self._checked_parameters = set()
+
     @abstractmethod
     def pressure(self, rho, T, xi):
         """
@@ -143,7 +146,7 @@ class EosTemplate(ABC):
         ----------
         parameter : str
             Parameter to be fit. See EOS documentation for supported parameter names.
-        bead_names : list
+        bead_names : list or tuple
             Bead names to be changed. For a self interaction parameter, the length will be 1, for a cross interaction parameter, the length will be two.
 
         Returns
@@ -235,8 +238,7 @@ class EosTemplate(ABC):
                     )
                 )
 
-        fit_parameter_names_list = param_name.split("_")
-        parameter = fit_parameter_names_list[0]
+        parameter = param_name.partition("_")[0]
 
         bounds_new = np.zeros(2)
         # Non bonded parameters
@@ -301,13 +303,29 @@ class EosTemplate(ABC):
         ----------
         param_name : str
             Parameter to be fit. See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
-        bead_names : list
+        bead_names : list or tuple
             Bead names to be changed. For a self interaction parameter, the length will be 1, for a cross interaction parameter, the length will be two.
         param_value : float
             Value of parameter
 
         """
 
+        self._check_parameter(param_name, bead_names)
+        self._set_parameter(param_name, bead_names, param_value)
+
+    def _check_parameter(self, param_name, bead_names):
+        r"""
+        Check that a parameter may be updated with :meth:`update_parameter`. Subclasses may extend this check.
+
+        Parameters
+        ----------
+        param_name : str
+            Parameter to be fit.
+        bead_names : list or tuple
+            Bead names to be changed.
+
+        """
+
         keys = ["beads", "parameter_types", "bead_library", "cross_library"]
         for key in keys:
             if getattr(self, key) == None:
@@ -337,6 +355,21 @@ class EosTemplate(ABC):
                 )
             )
 
+    def _set_parameter(self, param_name, bead_names, param_value):
+        r"""
+        Store a parameter value that was checked with :meth:`_check_parameter` in bead_library or cross_library.
+
+        Parameters
+        ----------
+        param_name : str
+            Parameter to be fit.
+        bead_names : list or tuple
+            Bead names to be changed.
+        param_value : float
+            Value of parameter
+
+        """
+
         # Self interaction parameter
         if len(bead_names) == 1:
             if bead_names[0] in self.bead_library:
@@ -365,3 +398,32 @@ class EosTemplate(ABC):
                 self.cross_library[bead_names[0]] = {
                     bead_names[1]: {param_name: param_value}
                 }
+
+    def update_parameters(self, updates):
+        r"""
+        Update several parameter values during parameter fitting process.
+
+        Parameters that are dependent on bead_library or cross_library should be refreshed after all parameters are updated. If a subclass overrides :meth:`update_parameter`, it's called for each entry.
+
+        Parameters
+        ----------
+        updates : list[tuple]
+            List of (param_name, bead_names, param_value) for each parameter to be updated. See :meth:`update_parameter` for a description of each entry.
+
+        """
+
+        if type(self).update_parameter is not EosTemplate.update_parameter:
+            update_parameter = self.update_parameter
+            for param_name, bead_names, param_value in updates:
+                update_parameter(param_name, bead_names, param_value)
+            return
+
+        # Each parameter and set of beads is only checked the first time it's updated
+        checked = self._checked_parameters
+        set_parameter = self._set_parameter
+        for param_name, bead_names, param_value in updates:
+            key = (param_name, tuple(bead_names))
+            if key not in checked:
+                self._check_parameter(param_name, bead_names)
+                checked.add(key)
+            set_parameter(param_name, bead_names, param_value)
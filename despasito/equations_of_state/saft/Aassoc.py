@@ -37,8 +37,10 @@ from .compiled_modules.ext_Aassoc_numba import calc_Xika as calc_Xika_numba
 from .compiled_modules.ext_Aassoc_python import calc_Xika as calc_Xika_python
 
 
-def _calc_Xika_wrap(*args, method_stat, maxiter=500, tol=1e-12, damp=0.1):
+def _calc_Xika_wrap(*args, method_stat, maxiter=500, tol=1e-12, damp=0.1, out=None):
     r""" This function wrapper allows difference types of compiled functions to be referenced.
+
+    The optional array, ``out``, is reused to store Xika by the numba function.
     """
 
     indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc = args
@@ -66,7 +68,7 @@ def _calc_Xika_wrap(*args, method_stat, maxiter=500, tol=1e-12, damp=0.1):
                 Xika, _ = calc_Xika_python(*args)
                 logger.warning("Using pure python. Consider using 'numba' flag")
             elif method_stat.numba or not flag_fortran or not flag_cython:
-                Xika, _ = calc_Xika_numba(*args)
+                Xika, _ = calc_Xika_numba(*args, out=out)
             else:
                 raise ValueError("Appropriate options for calc_Xika have not been defined.")
 
@@ -93,7 +95,7 @@ def _calc_Xika_wrap(*args, method_stat, maxiter=500, tol=1e-12, damp=0.1):
                 Xika, _ = calc_Xika_python(*args)
                 logger.warning("Using pure python. Consider using 'numba' flag")
             elif method_stat.numba or not flag_fortran or not flag_cython:
-                Xika, _ = calc_Xika_numba(*args)
+                Xika, _ = calc_Xika_numba(*args, out=out)
             else:
                 raise ValueError("Appropriate options for calc_Xika have not been defined.")
 
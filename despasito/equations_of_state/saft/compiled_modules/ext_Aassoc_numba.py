@@ -3,8 +3,13 @@ import numba
 
 from despasito.equations_of_state import constants
 
+# Minimum number of densities before the association site calculation is split among threads
+parallel_threshold = 200
 
-def calc_Xika(indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc):
+
+def calc_Xika(
+    indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc, out=None
+):
     r""" 
     A wrapper to calculate the fraction of molecules of component i that are not bonded at a site of type a on group k. Switched between functions for different Kklab
 
@@ -26,56 +31,60 @@ def calc_Xika(indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_asso
         Bonding volume between each association site
     gr_assoc : numpy.ndarray
         Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    out : numpy.ndarray, Optional, default=None
+        Array of shape (len(rho) x len(indices)), with the same floating point type as ``Fklab``, where Xika is stored. If this array is not C-contiguous or of the correct shape and type, a new array is allocated.
 
     Returns
     -------
     Xika : numpy.ndarray
-        The fraction of molecules of component i that are not bonded at a site of type a on group k. Matrix (len(rho) x Ncomp x Nbeads x len(sitenames))
+        The fraction of molecules of component i that are not bonded at a site of type a on group k. Matrix (len(rho) x Ncomp x Nbeads x len(sitenames)), with the same floating point type as ``Fklab``
     err_array : numpy.ndarray
         Of the same length of rho, is a list in the error of the total error Xika for each point. 
     """
 
     l_K = len(np.shape(Kklab))
 
-    # Ensure all inputs are numpy arrays
+    # Cast inputs to contiguous arrays of fixed types, so the kernels are compiled once for each precision
+    if np.asarray(Fklab).dtype == np.float32:
+        ftype = np.float32
+    else:
+        ftype = np.float64
+    indices = np.ascontiguousarray(indices, dtype=np.int64)
     tmp_array = [rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc]
-    for i,tmp in enumerate(tmp_array):
-        if np.shape(tmp):
-            tmp_array[i] = np.array(tmp)
-        else:
-            tmp_array[i] = np.array([tmp])
+    dtypes = [float, float, float, float, ftype, ftype, ftype]
+    for i, tmp in enumerate(tmp_array):
+        tmp_array[i] = np.ascontiguousarray(np.atleast_1d(tmp), dtype=dtypes[i])
     rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc = tmp_array
 
+    shape = (len(rho), len(indices))
+    if (
+        out is None
+        or np.shape(out) != shape
+        or out.dtype != ftype
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        out = np.empty(shape, dtype=ftype)
+
     if l_K == 4:
         Xika_final, err_array = calc_Xika_4(
-            indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
+            indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc, out
         )
     if l_K == 6:
         Xika_final, err_array = calc_Xika_6(
-            indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
+            indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc, out
         )
 
     return Xika_final, err_array
 
 
-#@numba.njit(
-#    numba.types.Tuple((numba.f8[:, :], numba.f8[:]))(
-#        numba.i8[:, :],
-#        numba.f8[:],
-#        numba.f8[:],
-#        numba.f8[:, :],
-#        numba.i8[:, :],
-#        numba.f8[:, :, :, :],
-#        numba.f8[:, :, :, :],
-#        numba.f8[:, :, :],
-#    )
-#)
-@numba.njit()
-def calc_Xika_4(
-    indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
-):  # , maxiter=500, tol=1e-12, damp=.1
+@numba.njit(cache=True)
+def _calc_Xika_fixed_point(
+    indices, rho, xi, molecular_composition, nk, FKklab, gr_assoc, Xika_final
+):
     r""" 
-    Calculate the fraction of molecules of component i that are not bonded at a site of type a on group k.
+    Solve for the fraction of molecules of component i that are not bonded at a site of type a on group k with successive substitution.
+
+    For short density arrays, the solution at each density is used as the initial guess for the next. Long density arrays are split among threads, where each density starts from the same initial guess.
 
     Parameters
     ----------
@@ -89,12 +98,12 @@ def calc_Xika_4(
         :math:`\nu_{i,k}/k_B`, Array of number of components by number of bead types. Defines the number of each type of group in each component. 
     nk : numpy.ndarray
         For each bead the number of each type of site
-    Fklab : numpy.ndarray
-        The association strength between a site of type a on a group of type k of component i and a site of type b on a group of type l of component j., known as the Mayer f-function.
-    Kklab : numpy.ndarray
-        Bonding volume between each association site
+    FKklab : numpy.ndarray
+        Product of the Mayer f-function and the bonding volume for each pair of entries in ``indices``, (len(indices) x len(indices))
     gr_assoc : numpy.ndarray
         Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    Xika_final : numpy.ndarray
+        Array of shape (len(rho) x len(indices)) where the solution is stored
 
     Returns
     -------
@@ -104,79 +113,189 @@ def calc_Xika_4(
         Of the same length of rho, is a list in the error of the total error Xika for each point. 
     """
 
-    maxiter = 500
-    tol = 1e-12
-    damp = 0.1
-
     nrho = len(rho)
     l_ind = len(indices)
 
-    #    Xika_final = np.ones((nrho,ncomp, nbeads, nsitesmax))
-    Xika_final = np.ones((nrho, l_ind))
+    # Number of sites of each type per molecule, weighted by composition
+    site_fraction = np.zeros(l_ind)
+    for jjnd in range(l_ind):
+        j, l, b = indices[jjnd]
+        site_fraction[jjnd] = xi[j] * molecular_composition[j, l] * nk[l, b]
+
+    # Contiguous component index of each site, read in the innermost loop
+    site_component = indices[:, 0].copy()
+
+    if nrho >= parallel_threshold:
+        return _calc_Xika_parallel(
+            site_component, rho, site_fraction, FKklab, gr_assoc, Xika_final
+        )
+
+    dtype = FKklab.dtype
     err_array = np.zeros(nrho)
 
-    # Parallelize here, wrt rho!
-    Xika_elements = 0.5 * np.ones(l_ind)
+    Xika_elements = np.full(l_ind, 0.5, dtype=dtype)
+    Xika_elements_new = np.ones(l_ind, dtype=dtype)
+    delta = np.zeros((l_ind, l_ind), dtype=dtype)
     for r in range(nrho):
-        for knd in range(maxiter):
+        err_array[r] = _solve_Xika(
+            r,
+            site_component,
+            rho,
+            site_fraction,
+            FKklab,
+            gr_assoc,
+            Xika_elements,
+            Xika_elements_new,
+            delta,
+        )
+        Xika_final[r, :] = Xika_elements
 
-            Xika_elements_new = np.ones(l_ind)
-            ind = 0
-            for iind in range(l_ind):
-                i, k, a = indices[iind]
-                jnd = 0
-                for jjnd in range(l_ind):
-                    j, l, b = indices[jjnd]
-                    delta = Fklab[k, l, a, b] * Kklab[k, l, a, b] * gr_assoc[r, i, j]
-                    Xika_elements_new[ind] += (
-                        constants.molecule_per_nm3
-                        * rho[r]
-                        * xi[j]
-                        * molecular_composition[j, l]
-                        * nk[l, b]
-                        * Xika_elements[jnd]
-                        * delta
-                    )
-                    jnd += 1
-                ind += 1
-            Xika_elements_new = 1.0 / Xika_elements_new
-            obj = np.sum(np.abs(Xika_elements_new - Xika_elements))
-
-            if obj < tol:
-                break
-            else:
-                if obj / np.max(Xika_elements) > 1e3:
-                    Xika_elements = Xika_elements + damp * (
-                        Xika_elements_new - Xika_elements
-                    )
-                else:
-                    Xika_elements = Xika_elements_new
-
-        err_array[r] = obj
+    return Xika_final, err_array
+
+
+@numba.njit(parallel=True, cache=True)
+def _calc_Xika_parallel(
+    site_component, rho, site_fraction, FKklab, gr_assoc, Xika_final
+):
+    r""" 
+    Solve for the fraction of molecules of component i that are not bonded at a site of type a on group k, where the densities are split among threads.
 
+    Parameters
+    ----------
+    site_component : numpy.ndarray
+        Index of the component of each association site, given by the first column of the (component, bead, site) indices
+    rho : numpy.ndarray
+        Number density of system [mol/m^3]
+    site_fraction : numpy.ndarray
+        For each association site, the mole fraction of the component multiplied by the number of groups in the component and the number of sites on the group
+    FKklab : numpy.ndarray
+        Product of the Mayer f-function and the bonding volume for each pair of association sites, (Nsites x Nsites)
+    gr_assoc : numpy.ndarray
+        Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    Xika_final : numpy.ndarray
+        Array of shape (len(rho) x len(indices)) where the solution is stored
+
+    Returns
+    -------
+    Xika : numpy.ndarray
+        The fraction of molecules of component i that are not bonded at a site of type a on group k. Matrix (len(rho) x Ncomp x Nbeads x len(sitenames))
+    err_array : numpy.ndarray
+        Of the same length of rho, is a list in the error of the total error Xika for each point. 
+    """
+
+    nrho = len(rho)
+    l_ind = len(site_component)
+
+    dtype = FKklab.dtype
+    err_array = np.zeros(nrho)
+
+    for r in numba.prange(nrho):
+        Xika_elements = np.full(l_ind, 0.5, dtype=dtype)
+        err_array[r] = _solve_Xika(
+            r,
+            site_component,
+            rho,
+            site_fraction,
+            FKklab,
+            gr_assoc,
+            Xika_elements,
+            np.ones(l_ind, dtype=dtype),
+            np.zeros((l_ind, l_ind), dtype=dtype),
+        )
         Xika_final[r, :] = Xika_elements
-        # for jjnd in range(l_ind):
-        #    i,k,a = indices[jjnd]
-        #    Xika_final[r,i,k,a] = Xika_elements[jjnd]
 
     return Xika_final, err_array
 
 
-#@numba.njit(
-#    numba.types.Tuple((numba.f8[:, :], numba.f8[:]))(
-#        numba.i8[:, :],
-#        numba.f8[:],
-#        numba.f8[:],
-#        numba.f8[:, :],
-#        numba.i8[:, :],
-#        numba.f8[:, :, :, :],
-#        numba.f8[:, :, :, :, :, :],
-#        numba.f8[:, :, :],
-#    )
-#)
-@numba.njit()
-def calc_Xika_6(
-    indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc
+@numba.njit(cache=True)
+def _solve_Xika(
+    r,
+    site_component,
+    rho,
+    site_fraction,
+    FKklab,
+    gr_assoc,
+    Xika_elements,
+    Xika_elements_new,
+    delta,
+):  # , maxiter=500, tol=1e-12, damp=.1
+    r""" 
+    Iterate the fraction of non-bonded sites at a single density until converged.
+
+    Parameters
+    ----------
+    r : int
+        Index of the density in ``rho`` to solve
+    site_component : numpy.ndarray
+        Index of the component of each association site, given by the first column of the (component, bead, site) indices
+    rho : numpy.ndarray
+        Number density of system [mol/m^3]
+    site_fraction : numpy.ndarray
+        For each association site, the mole fraction of the component multiplied by the number of groups in the component and the number of sites on the group
+    FKklab : numpy.ndarray
+        Product of the Mayer f-function and the bonding volume for each pair of association sites, (Nsites x Nsites)
+    gr_assoc : numpy.ndarray
+        Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    Xika_elements : numpy.ndarray
+        Initial guess of the fraction of non-bonded sites for each association site. This array is updated in place with the solution.
+    Xika_elements_new : numpy.ndarray
+        Work array of the same length as ``Xika_elements``
+    delta : numpy.ndarray
+        Work array of shape (Nsites x Nsites)
+
+    Returns
+    -------
+    obj : float
+        Total error in Xika for this density
+    """
+
+    l_ind = len(site_component)
+
+    maxiter = 500
+    # Single precision arrays cannot resolve changes below their machine epsilon
+    tol = max(1e-12, l_ind * np.finfo(Xika_elements.dtype).eps)
+    damp = 0.1
+
+    rho_tmp = constants.molecule_per_nm3 * rho[r]
+    for iind in range(l_ind):
+        i = site_component[iind]
+        for jjnd in range(l_ind):
+            j = site_component[jjnd]
+            delta[iind, jjnd] = (
+                rho_tmp * site_fraction[jjnd] * FKklab[iind, jjnd] * gr_assoc[r, i, j]
+            )
+
+    obj = 0.0
+    for knd in range(maxiter):
+
+        obj = 0.0
+        Xika_max = 0.0
+        for iind in range(l_ind):
+            tmp = 1.0
+            for jjnd in range(l_ind):
+                tmp += delta[iind, jjnd] * Xika_elements[jjnd]
+            Xika_elements_new[iind] = 1.0 / tmp
+            obj += np.abs(Xika_elements_new[iind] - Xika_elements[iind])
+            if Xika_elements[iind] > Xika_max:
+                Xika_max = Xika_elements[iind]
+
+        if obj < tol:
+            break
+        elif obj / Xika_max > 1e3:
+            for iind in range(l_ind):
+                Xika_elements[iind] += damp * (
+                    Xika_elements_new[iind] - Xika_elements[iind]
+                )
+        else:
+            for iind in range(l_ind):
+                Xika_elements[iind] = Xika_elements_new[iind]
+
+    return obj
+
+
+@numba.njit(cache=True)
+def calc_Xika_4(
+    indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc, Xika_final
 ):  # , maxiter=500, tol=1e-12, damp=.1
     r""" 
     Calculate the fraction of molecules of component i that are not bonded at a site of type a on group k.
@@ -199,6 +318,8 @@ def calc_Xika_6(
         Bonding volume between each association site
     gr_assoc : numpy.ndarray
         Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    Xika_final : numpy.ndarray
+        Array of shape (len(rho) x len(indices)) where the solution is stored
 
     Returns
     -------
@@ -208,61 +329,67 @@ def calc_Xika_6(
         Of the same length of rho, is a list in the error of the total error Xika for each point. 
     """
 
-    maxiter = 500
-    tol = 1e-12
-    damp = 0.1
-
-    nrho = len(rho)
     l_ind = len(indices)
 
-    #    Xika_final = np.ones((nrho,ncomp, nbeads, nsitesmax))
-    Xika_final = np.ones((nrho, l_ind))
-    err_array = np.zeros(nrho)
+    # Density independent part of the association strength between each pair of sites
+    FKklab = np.zeros((l_ind, l_ind), dtype=Fklab.dtype)
+    for iind in range(l_ind):
+        i, k, a = indices[iind]
+        for jjnd in range(l_ind):
+            j, l, b = indices[jjnd]
+            FKklab[iind, jjnd] = Fklab[k, l, a, b] * Kklab[k, l, a, b]
 
-    # Parallelize here, wrt rho!
-    Xika_elements = 0.5 * np.ones(l_ind)
-    for r in range(nrho):
-        for knd in range(maxiter):
+    return _calc_Xika_fixed_point(
+        indices, rho, xi, molecular_composition, nk, FKklab, gr_assoc, Xika_final
+    )
 
-            Xika_elements_new = np.ones(l_ind)
-            ind = 0
-            for iind in range(l_ind):
-                i, k, a = indices[iind]
-                jnd = 0
-                for jjnd in range(l_ind):
-                    j, l, b = indices[jjnd]
-                    delta = (
-                        Fklab[k, l, a, b] * Kklab[i, j, k, l, a, b] * gr_assoc[r, i, j]
-                    )
-                    Xika_elements_new[ind] += (
-                        constants.molecule_per_nm3
-                        * rho[r]
-                        * xi[j]
-                        * molecular_composition[j, l]
-                        * nk[l, b]
-                        * Xika_elements[jnd]
-                        * delta
-                    )
-                    jnd += 1
-                ind += 1
-            Xika_elements_new = 1.0 / Xika_elements_new
-            obj = np.sum(np.abs(Xika_elements_new - Xika_elements))
-
-            if obj < tol:
-                break
-            else:
-                if obj / np.max(Xika_elements) > 1e3:
-                    Xika_elements = Xika_elements + damp * (
-                        Xika_elements_new - Xika_elements
-                    )
-                else:
-                    Xika_elements = Xika_elements_new
-
-        err_array[r] = obj
 
-        Xika_final[r, :] = Xika_elements
-        # for jjnd in range(l_ind):
-        #    i,k,a = indices[jjnd]
-        #    Xika_final[r,i,k,a] = Xika_elements[jjnd]
+@numba.njit(cache=True)
+def calc_Xika_6(
+    indices, rho, xi, molecular_composition, nk, Fklab, Kklab, gr_assoc, Xika_final
+):  # , maxiter=500, tol=1e-12, damp=.1
+    r""" 
+    Calculate the fraction of molecules of component i that are not bonded at a site of type a on group k.
 
-    return Xika_final, err_array
+    Parameters
+    ----------
+    indices : list[list]
+        A list of sets of (component, bead, site) to identify the values of the Xika matrix that are being fit
+    rho : numpy.ndarray
+        Number density of system [mol/m^3]
+    xi : numpy.ndarray
+        Mole fraction of each component, sum(xi) should equal 1.0
+    molecular_composition : numpy.array
+        :math:`\nu_{i,k}/k_B`, Array of number of components by number of bead types. Defines the number of each type of group in each component. 
+    nk : numpy.ndarray
+        For each bead the number of each type of site
+    Fklab : numpy.ndarray
+        The association strength between a site of type a on a group of type k of component i and a site of type b on a group of type l of component j., known as the Mayer f-function.
+    Kklab : numpy.ndarray
+        Bonding volume between each association site
+    gr_assoc : numpy.ndarray
+        Reference fluid pair correlation function used in calculating association sites, (len(rho) x Ncomp x Ncomp)
+    Xika_final : numpy.ndarray
+        Array of shape (len(rho) x len(indices)) where the solution is stored
+
+    Returns
+    -------
+    Xika : numpy.ndarray
+        The fraction of molecules of component i that are not bonded at a site of type a on group k. Matrix (len(rho) x Ncomp x Nbeads x len(sitenames))
+    err_array : numpy.ndarray
+        Of the same length of rho, is a list in the error of the total error Xika for each point. 
+    """
+
+    l_ind = len(indices)
+
+    # Density independent part of the association strength between each pair of sites
+    FKklab = np.zeros((l_ind, l_ind), dtype=Fklab.dtype)
+    for iind in range(l_ind):
+        i, k, a = indices[iind]
+        for jjnd in range(l_ind):
+            j, l, b = indices[jjnd]
+            FKklab[iind, jjnd] = Fklab[k, l, a, b] * Kklab[i, j, k, l, a, b]
+
+    return _calc_Xika_fixed_point(
+        indices, rho, xi, molecular_composition, nk, FKklab, gr_assoc, Xika_final
+    )
@@ -55,47 +55,36 @@ def calc_Xika(
         Of the same length of rho, is a list in the error of the total error Xika for each point.
     """
 
-    # ncomp, nbeads = np.shape(molecular_composition)
-    # nsitesmax = np.shape(nk)[1]
     nrho = len(rho)
     l_ind = len(indices)
     l_K = len(np.shape(Kklab))
 
-    #    Xika_final = np.ones((nrho,ncomp, nbeads, nsitesmax))
-    Xika_final = np.ones((nrho, len(indices)))
+    # Association strength between each pair of sites for all densities
+    i, k, a = np.asarray(indices, dtype=int).T
+    ii, jj = np.ix_(range(l_ind), range(l_ind))
+    if l_K == 4:
+        FKklab = Fklab[k[ii], k[jj], a[ii], a[jj]] * Kklab[k[ii], k[jj], a[ii], a[jj]]
+    elif l_K == 6:
+        FKklab = (
+            Fklab[k[ii], k[jj], a[ii], a[jj]]
+            * Kklab[i[ii], i[jj], k[ii], k[jj], a[ii], a[jj]]
+        )
+    site_fraction = np.asarray(xi)[i] * molecular_composition[i, k] * nk[k, a]
+    delta = np.einsum(
+        "r,j,ij,rij->rij",
+        constants.molecule_per_nm3 * np.asarray(rho),
+        site_fraction,
+        FKklab,
+        gr_assoc[:, i[ii], i[jj]],
+    )
+
+    Xika_final = np.ones((nrho, l_ind))
     err_array = np.zeros(nrho)
 
-    # Parallelize here, with respect to rho!
-    Xika_elements_old = 0.5 * np.ones(len(indices))
+    Xika_elements_old = 0.5 * np.ones(l_ind)
     for r in range(nrho):
         for knd in range(maxiter):
-            Xika_elements_new = np.ones(len(Xika_elements_old))
-            for ind in range(l_ind):
-                i, k, a = indices[ind]
-                for jnd in range(l_ind):
-                    j, l, b = indices[jnd]
-                    if l_K == 4:
-                        delta = (
-                            Fklab[k, l, a, b] * Kklab[k, l, a, b] * gr_assoc[r, i, j]
-                        )
-                    elif l_K == 6:
-                        delta = (
-                            Fklab[k, l, a, b]
-                            * Kklab[i, j, k, l, a, b]
-                            * gr_assoc[r, i, j]
-                        )
-                    
-                    Xika_elements_new[ind] += (
-                        constants.molecule_per_nm3
-                        * rho[r]
-                        * xi[j]
-                        * molecular_composition[j, l]
-                        * nk[l, b]
-                        * Xika_elements_old[jnd]
-                        * delta
-                    )
-
-            Xika_elements_new = 1.0 / Xika_elements_new
+            Xika_elements_new = 1.0 / (1.0 + delta[r].dot(Xika_elements_old))
             obj = np.sum(np.abs(Xika_elements_new - Xika_elements_old))
 
             if obj < tol:
@@ -111,8 +100,5 @@ def calc_Xika(
         err_array[r] = obj
 
         Xika_final[r, :] = Xika_elements_old
-        # for jjnd in range(l_ind):
-        #    i,k,a = indices[jjnd]
-        #    Xika_final[r,i,k,a] = Xika_elements[jjnd]
 
     return Xika_final, err_array
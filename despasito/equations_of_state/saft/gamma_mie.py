@@ -703,7 +703,7 @@ class SaftType:
         km = np.zeros((np.size(rho), 4))
         gdHS = np.zeros((np.size(rho), np.size(xi)))
 
-        km[:, 0] = -np.log(1.0 - zetax) + (
+        km[:, 0] = -np.log1p(-zetax) + (
             42.0 * zetax - 39.0 * zetax ** 2 + 9.0 * zetax ** 3 - 2.0 * zetax ** 4
         ) / (6.0 * (1.0 - zetax) ** 3)
         km[:, 1] = (zetax ** 4 + 6.0 * zetax ** 2 - 12.0 * zetax) / (
@@ -885,7 +885,7 @@ class SaftType:
             (1.0 / (self.eos_dict["lambdaaii_avg"] - 3.0))
             - (1.0 / (self.eos_dict["lambdarii_avg"] - 3.0))
         )
-        theta = np.exp(self.eos_dict["epsilonii_avg"] / T) - 1.0
+        theta = np.expm1(self.eos_dict["epsilonii_avg"] / T)
 
         gammacii = np.zeros((np.size(rho), np.size(xi)))
         for i in range(self.ncomp):
@@ -1425,19 +1425,19 @@ class SaftType:
 
         """
 
-        if np.isscalar(rho):
-            rho = np.array([rho])
-        elif type(rho) != np.ndarray:
-            rho = np.array(rho)
-        if len(np.shape(rho)) == 2:
+        rho = np.ascontiguousarray(rho, dtype=float)
+        if rho.ndim == 0:
+            rho = rho.reshape(1)
+        elif rho.ndim == 2:
             rho = rho[0]
 
-        if any(np.isnan(rho)):
-            raise ValueError("NaN was given as a value of density, rho")
-        elif rho.size == 0:
+        if rho.size == 0:
             raise ValueError("No value of density, rho, was given")
-        elif any(rho < 0.0):
-            raise ValueError("Density values cannot be negative.")
+        elif not (rho >= 0.0).all():
+            if np.isnan(rho).any():
+                raise ValueError("NaN was given as a value of density, rho")
+            else:
+                raise ValueError("Density values cannot be negative.")
 
         return rho
 
@@ -931,19 +931,19 @@ class SaftType:
             Number density of system [:math:`mol/m^3`]
         """
 
-        if np.isscalar(rho):
-            rho = np.array([rho])
-        elif type(rho) != np.ndarray:
-            rho = np.array(rho)
-        if len(np.shape(rho)) == 2:
+        rho = np.ascontiguousarray(rho, dtype=float)
+        if rho.ndim == 0:
+            rho = rho.reshape(1)
+        elif rho.ndim == 2:
             rho = rho[0]
 
-        if any(np.isnan(rho)):
-            raise ValueError("NaN was given as a value of density, rho")
-        elif rho.size == 0:
+        if rho.size == 0:
             raise ValueError("No value of density was given")
-        elif any(rho < 0.0):
-            raise ValueError("Density values cannot be negative.")
+        elif not (rho >= 0.0).all():
+            if np.isnan(rho).any():
+                raise ValueError("NaN was given as a value of density, rho")
+            else:
+                raise ValueError("Density values cannot be negative.")
 
         return rho
 
@@ -98,6 +98,8 @@ class EosType(EosTemplate):
         Reduced distance of the sites from the center of the sphere of interaction. This value is used when site position, ``eos_dict['rd_klab'] == None``. See :func:`~despasito.equations_of_state.saft.Aassoc.calc_bonding_volume` for more details.
     method_stat : obj
         EOS object containing the the method status of the available options. 
+    eos_dtype : numpy.dtype, Optional, default=numpy.float64
+        Floating point type of the arrays used in the association site calculation. Single precision, ``numpy.float32``, is faster and is sufficient for evaluating objective functions during parameter fitting.
     kwargs
         Other keywords that are specific to the chosen SAFT variant
 
@@ -126,6 +128,8 @@ class EosType(EosTemplate):
         Define the SAFT variant, options listed in :func:`~despasito.equations_of_state.saft.saft.saft_type`.
     saft_source : obj
         Object representing SAFT variant. This attribute can be used to access intermediate calculations.
+    eos_dtype : numpy.dtype
+        Floating point type of the arrays used in the association site calculation. See entry in **Parameters** section.
     eos_dict : dict
         Temperature value is initially defined as NaN for a placeholder until temperature dependent attributes are initialized by using a method of this class.
 
@@ -138,6 +142,10 @@ class EosType(EosTemplate):
         - nk (numpy.ndarray) - A matrix of (Nbeads x Nsites) Contains for each bead the number of each type of site
         - epsilonHB (numpy.ndarray) - Optional, Interaction energy between each bead and association site.
         - Kklab (numpy.ndarray) - Optional, Bonding volume between each association site
+        - Fklab (numpy.ndarray) - Optional, Mayer f-function of the association energy, stored for the last temperature used
+        - assoc_site_indices (numpy.ndarray) - Optional, Array of (component, bead, site) indices for each association site present in the system. See :func:`~despasito.equations_of_state.saft.Aassoc.assoc_site_indices`
+        - assoc_site_component (numpy.ndarray) - Optional, Contiguous array of the component index of each entry in ``assoc_site_indices``
+        - assoc_site_nu_nk (numpy.ndarray) - Optional, For each entry in ``assoc_site_indices``, the number of groups in the component multiplied by the number of sites on the group
         - rc_klab, Optional, Cutoff distance for association sites
         - rd_klab, Optional, Association site position
         - reduction_ratio (float) - Reduced distance of the sites from the center of the sphere of interaction. This value is used when site position, ``eos_dict['rd_klab'] == None``.
@@ -145,12 +153,18 @@ class EosType(EosTemplate):
     """
 
     def __init__(
-        self, saft_name="gamma_mie", Aideal_method=None, combining_rules=None, **kwargs
+        self,
+        saft_name="gamma_mie",
+        Aideal_method=None,
+        combining_rules=None,
+        eos_dtype=np.float64,
+        **kwargs
     ):
 
         super().__init__(**kwargs)
 
         self.saft_name = saft_name
+        self.eos_dtype = eos_dtype
         saft_source = saft_type(saft_name)
         self.saft_source = saft_source(**kwargs)
 
@@ -249,6 +263,24 @@ class EosType(EosTemplate):
 
         if self.eos_dict["flag_assoc"]:
             self.T = None
+            self._Xika_buffer = None
+            # Site indices and composition weights do not change with parameter updates
+            self.eos_dict["assoc_site_indices"] = Aassoc.assoc_site_indices(
+                self.eos_dict["nk"], self.eos_dict["molecular_composition"]
+            )
+            i, k, a = self.eos_dict["assoc_site_indices"].T
+            self.eos_dict["assoc_site_component"] = np.ascontiguousarray(i)
+            self.eos_dict["assoc_site_nu_nk"] = (
+                self.eos_dict["molecular_composition"][i, k] * self.eos_dict["nk"][k, a]
+            )
+
+        # Resolve residual contributions once, rather than with each call
+        self._residual_helmholtz_functions = tuple(
+            getattr(self.saft_source, res)
+            for res in self.eos_dict["residual_helmholtz_contributions"]
+        )
+        if self.eos_dict["flag_assoc"]:
+            self._residual_helmholtz_functions += (self._Aassoc,)
 
         if combining_rules != None:
             logger.info("Accepted new combining rule definitions")
@@ -276,26 +308,11 @@ class EosType(EosTemplate):
         Ares : numpy.ndarray
             Residual Helmholtz energy for each density value given.
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         rho = self._check_density(rho)
 
-        if any(np.array(xi) < 0.0):
-            raise ValueError("Mole fractions cannot be less than zero.")
-
-        Ares = np.zeros(len(rho))
-        for res in self.eos_dict["residual_helmholtz_contributions"]:
-            Ares += getattr(self.saft_source, res)(rho, T, xi)
-
-        if self.eos_dict["flag_assoc"]:
-            Ares += self.Aassoc(rho, T, xi)
-
-        return Ares
+        return self._residual_helmholtz_energy(rho, T, xi)
 
     def helmholtz_energy(self, rho, T, xi):
         r"""
@@ -317,20 +334,11 @@ class EosType(EosTemplate):
         A : numpy.ndarray
             Total Helmholtz energy for each density value given.
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         rho = self._check_density(rho)
 
-        A = self.residual_helmholtz_energy(rho, T, xi) + self.Aideal(
-            rho, T, xi, method=self.eos_dict["Aideal_method"]
-        )
-
-        return A
+        return self._helmholtz_energy(rho, T, xi)
 
     def Aideal(self, rho, T, xi, method="Abroglie"):
         r"""
@@ -355,12 +363,7 @@ class EosType(EosTemplate):
             Helmholtz energy of ideal gas for each density given.
 
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         rho = self._check_density(rho)
 
@@ -390,63 +393,11 @@ class EosType(EosTemplate):
         """
 
         if self.eos_dict["flag_assoc"]:
-            if len(xi) != self.number_of_components:
-                raise ValueError(
-                    "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                        len(xi), self.number_of_components
-                    )
-                )
+            xi = self._normalize_xi(xi)
 
             rho = self._check_density(rho)
 
-            indices = Aassoc.assoc_site_indices(
-                self.eos_dict["nk"], self.eos_dict["molecular_composition"], xi=xi
-            )
-
-            # compute F_klab
-            Fklab = np.exp(self.eos_dict["epsilonHB"] / T) - 1.0
-            if "rc_klab" in self.eos_dict:
-                if "Kijklab" not in self.eos_dict or T != self.T:
-                    opts = {}
-                    keys = ["rd_klab", "reduction_ratio"]
-                    for key in keys:
-                        if key in self.eos_dict:
-                            opts[key] = self.eos_dict[key]
-                    self.eos_dict["Kijklab"] = self.saft_source.calc_Kijklab(T, self.eos_dict["rc_klab"], **opts)
-                    self.T = T
-                Kklab = self.eos_dict["Kijklab"]
-                Ktype = "ijklab"
-            else:
-                Kklab = self.eos_dict["Kklab"]
-                Ktype = "klab"
-
-            gr_assoc = self.saft_source.calc_gr_assoc(rho, T, xi, Ktype=Ktype)
-
-            # Compute Xika: with python with numba  {BottleNeck}
-
-            Xika = Aassoc._calc_Xika_wrap(
-                indices,
-                rho,
-                xi,
-                self.eos_dict["molecular_composition"],
-                self.eos_dict["nk"],
-                Fklab,
-                Kklab,
-                gr_assoc,
-                method_stat=self.method_stat
-            )
-
-            # Compute A_assoc
-            Assoc_contribution = np.zeros(np.size(rho))
-            for ind, (i, k, a) in enumerate(indices):
-                if self.eos_dict["nk"][k, a] != 0.0:
-                    tmp = np.log(Xika[:, ind]) + ((1.0 - Xika[:, ind]) / 2.0)
-                    Assoc_contribution += (
-                        xi[i]
-                        * self.eos_dict["molecular_composition"][i, k]
-                        * self.eos_dict["nk"][k, a]
-                        * tmp
-                    )
+            Assoc_contribution = self._Aassoc(rho, T, xi)
 
         else:
             logger.warning("Association Site contribution was called when the appropriate parameters were not provided. This should not occur.")
@@ -472,17 +423,17 @@ class EosType(EosTemplate):
         P : numpy.ndarray
             Array of pressure values [Pa] associated with each density and so equal in length
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         # derivative of Aideal_broglie here wrt to rho is 1/rho
         rho = self._check_density(rho)
+
         P_tmp = gtb.central_difference(
-            rho, self.helmholtz_energy, args=(T, xi), step_size=step_size, relative=True
+            rho,
+            self._helmholtz_energy,
+            args=(T, xi),
+            step_size=self._resolvable_step_size(step_size),
+            relative=True,
         )
         pressure = P_tmp * T * constants.R * rho ** 2
 
@@ -511,12 +462,7 @@ class EosType(EosTemplate):
         fugacity_coefficient : numpy.ndarray
             Array of fugacity coefficient values for each component
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         if gtb.isiterable(T):
             if len(T) == 1:
@@ -535,10 +481,16 @@ class EosType(EosTemplate):
                 raise ValueError("Pressure must be given as a scalar.")
 
         rho = self._check_density(rho)
+
         logZ = np.log(P / (rho * T * constants.R))
-        Ares = self.residual_helmholtz_energy(rho, T, xi)
+        Ares = self._residual_helmholtz_energy(rho, T, xi)
         dAresdrho = tb.partial_density_central_difference(
-            xi, rho, T, self.residual_helmholtz_energy, step_size=dy, log_method=True
+            xi,
+            rho,
+            T,
+            self._residual_helmholtz_energy,
+            step_size=self._resolvable_step_size(dy),
+            log_method=True,
         )
 
         phi = np.exp(Ares + rho * dAresdrho - logZ)
@@ -564,12 +516,7 @@ class EosType(EosTemplate):
         max_density : float
             Maximum molar density [:math:`mol/m^3`]
         """
-        if len(xi) != self.number_of_components:
-            raise ValueError(
-                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
-                    len(xi), self.number_of_components
-                )
-            )
+        xi = self._normalize_xi(xi)
 
         max_density = self.saft_source.density_max(xi, T, maxpack=maxpack)
 
@@ -600,20 +547,18 @@ class EosType(EosTemplate):
 
         return bounds_new
 
-    def update_parameter(self, param_name, bead_names, param_value):
+    def _check_parameter(self, param_name, bead_names):
         r"""
-        Update a single parameter value during parameter fitting process.
+        Check that a parameter may be updated with ``update_parameter``, including that association parameters name two sites.
 
-        To refresh those parameters that are dependent on to bead_library or cross_library, use method ``parameter_refresh``.
+        To refresh those parameters that are dependent on to bead_library or cross_library after an update, use method ``parameter_refresh``.
         
         Parameters
         ----------
         param_name : str
             Parameter to be fit. See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
-        bead_names : list
+        bead_names : list or tuple
             Bead names to be changed. For a self interaction parameter, the length will be one, for a cross interaction parameter, the length will be two.
-        param_value : float
-            Value of parameter
         """
 
         parameter_list = param_name.split("-")
@@ -624,7 +569,7 @@ class EosType(EosTemplate):
                 )
             )
 
-        super().update_parameter(param_name, bead_names, param_value)
+        super()._check_parameter(param_name, bead_names)
 
     def parameter_refresh(self):
         r""" 
@@ -647,6 +592,213 @@ class EosType(EosTemplate):
                 nk=self.eos_dict["nk"],
             )
             self.eos_dict.update(assoc_output)
+            # Force temperature dependent association parameters to be recomputed
+            self.T = None
+
+    def _residual_helmholtz_energy(self, rho, T, xi):
+        r"""
+        Return a vector of residual Helmholtz energy without validating the inputs. See :meth:`residual_helmholtz_energy`.
+
+        Parameters
+        ----------
+        rho : numpy.ndarray
+            Number density of system [:math:`mol/m^3`], as output from ``_check_density``
+        T : float
+            Temperature of the system [K]
+        xi : numpy.ndarray
+            Mole fraction of each component, sum(xi) should equal 1.0
+
+        Returns
+        -------
+        Ares : numpy.ndarray
+            Residual Helmholtz energy for each density value given.
+        """
+
+        Ares = np.zeros_like(rho)
+        for func in self._residual_helmholtz_functions:
+            Ares += func(rho, T, xi)
+
+        return Ares
+
+    def _helmholtz_energy(self, rho, T, xi):
+        r"""
+        Return a vector of Helmholtz energy without validating the inputs. See :meth:`helmholtz_energy`.
+
+        Parameters
+        ----------
+        rho : numpy.ndarray
+            Number density of system [:math:`mol/m^3`], as output from ``_check_density``
+        T : float
+            Temperature of the system [K]
+        xi : numpy.ndarray
+            Mole fraction of each component, sum(xi) should equal 1.0
+
+        Returns
+        -------
+        A : numpy.ndarray
+            Total Helmholtz energy for each density value given.
+        """
+
+        A = self._residual_helmholtz_energy(rho, T, xi) + Aideal.Aideal_contribution(
+            rho, T, xi, self.eos_dict["massi"], method=self.eos_dict["Aideal_method"]
+        )
+
+        return A
+
+    def _Aassoc(self, rho, T, xi):
+        r"""
+        Return a vector of association site contribution of Helmholtz energy without validating the inputs. See :meth:`Aassoc`.
+
+        Parameters
+        ----------
+        rho : numpy.ndarray
+            Number density of system [:math:`mol/m^3`], as output from ``_check_density``
+        T : float
+            Temperature of the system [K]
+        xi : numpy.ndarray
+            Mole fraction of each component, sum(xi) should equal 1.0
+
+        Returns
+        -------
+        Aassoc : numpy.ndarray
+            Helmholtz energy of association sites for each density given.
+        """
+
+        indices = self.eos_dict["assoc_site_indices"]
+
+        self._check_temperature_dependent_parameters(T)
+        dtype = self.eos_dtype
+        Fklab = self.eos_dict["Fklab"].astype(dtype, copy=False)
+        if "rc_klab" in self.eos_dict:
+            Kklab = self.eos_dict["Kijklab"].astype(dtype, copy=False)
+            Ktype = "ijklab"
+        else:
+            Kklab = self.eos_dict["Kklab"].astype(dtype, copy=False)
+            Ktype = "klab"
+
+        gr_assoc = self.saft_source.calc_gr_assoc(rho, T, xi, Ktype=Ktype)
+        gr_assoc = gr_assoc.astype(dtype, copy=False)
+
+        # Reuse storage for Xika among calls with the same number of densities
+        shape = (len(rho), len(indices))
+        if (
+            self._Xika_buffer is None
+            or self._Xika_buffer.shape != shape
+            or self._Xika_buffer.dtype != dtype
+        ):
+            self._Xika_buffer = np.empty(shape, dtype=dtype)
+
+        # Compute Xika: with python with numba  {BottleNeck}
+
+        Xika = Aassoc._calc_Xika_wrap(
+            indices,
+            rho,
+            xi,
+            self.eos_dict["molecular_composition"],
+            self.eos_dict["nk"],
+            Fklab,
+            Kklab,
+            gr_assoc,
+            method_stat=self.method_stat,
+            out=self._Xika_buffer,
+        )
+        Xika = np.asarray(Xika, dtype=float)
+
+        # Compute A_assoc
+        weights = (
+            np.asarray(xi)[self.eos_dict["assoc_site_component"]]
+            * self.eos_dict["assoc_site_nu_nk"]
+        )
+        # log(Xika) + (1 - Xika)/2, accurate for Xika near one
+        Xika -= 1.0
+        tmp = np.log1p(Xika)
+        tmp -= 0.5 * Xika
+
+        return tmp.dot(weights)
+
+    def _resolvable_step_size(self, step_size):
+        r"""
+        Increase a relative step size for central difference methods if it is too small to be resolved with the floating point type, ``eos_dtype``.
+
+        The step size is unchanged for double precision.
+
+        Parameters
+        ----------
+        step_size : float
+            Requested relative step size
+
+        Returns
+        -------
+        step_size : float
+            Relative step size that is at least the cube root of the machine epsilon of ``eos_dtype``
+        """
+
+        eps = np.finfo(self.eos_dtype).eps
+        if eps > np.finfo(float).eps:
+            step_size = max(step_size, eps ** (1.0 / 3.0))
+
+        return step_size
+
+    def _normalize_xi(self, xi):
+        r"""
+        Check that the mole fractions are valid and return them as a contiguous array.
+
+        Parameters
+        ----------
+        xi : numpy.ndarray
+            Mole fraction of each component, sum(xi) should equal 1.0
+
+        Returns
+        -------
+        xi : numpy.ndarray
+            Mole fraction of each component as a contiguous array of floats
+        """
+
+        xi = np.ascontiguousarray(xi, dtype=float)
+        if len(xi) != self.number_of_components:
+            raise ValueError(
+                "Number of components in mole fraction list, {}, doesn't match self.number_of_components, {}".format(
+                    len(xi), self.number_of_components
+                )
+            )
+        if (xi < 0.0).any():
+            raise ValueError("Mole fractions cannot be less than zero.")
+
+        return xi
+
+    def _check_temperature_dependent_parameters(self, T):
+        r"""
+        This function checks that the temperature dependent association site parameters are computed for the correct value. If not, they are recomputed.
+
+        Parameters
+        ----------
+        T : float
+            Temperature of the system [K]
+
+        Attributes
+        ---------
+        T : float
+            Updated temperature value
+        eos_dict : dict
+            The following entries are updated:
+
+            - Fklab (numpy.ndarray) - The association strength between a site of type a on a group of type k and a site of type b on a group of type l, known as the Mayer f-function.
+            - Kijklab (numpy.ndarray) - Optional, Bonding volume between each association site, only computed when ``rc_klab`` is defined.
+
+        """
+
+        if self.T != T:
+            self.eos_dict["Fklab"] = np.expm1(self.eos_dict["epsilonHB"] / T)
+            if "rc_klab" in self.eos_dict:
+                opts = {}
+                keys = ["rd_klab", "reduction_ratio"]
+                for key in keys:
+                    if key in self.eos_dict:
+                        opts[key] = self.eos_dict[key]
+                self.eos_dict["Kijklab"] = self.saft_source.calc_Kijklab(
+                    T, self.eos_dict["rc_klab"], **opts
+                )
+            self.T = T
 
     def _check_density(self, rho):
         r"""
@@ -658,19 +810,19 @@ class EosType(EosTemplate):
             Number density of system [:math:`mol/m^3`]
         """
 
-        if np.isscalar(rho):
-            rho = np.array([rho])
-        elif type(rho) != np.ndarray:
-            rho = np.array(rho)
-        if len(np.shape(rho)) == 2:
+        rho = np.ascontiguousarray(rho, dtype=float)
+        if rho.ndim == 0:
+            rho = rho.reshape(1)
+        elif rho.ndim == 2:
             rho = rho[0]
 
-        if any(np.isnan(rho)):
-            raise ValueError("NaN was given as a value of density, rho")
-        elif rho.size == 0:
+        if rho.size == 0:
             raise ValueError("No value of density, rho, was given")
-        elif any(rho < 0.0):
-            raise ValueError("Density values cannot be negative.")
+        elif not (rho >= 0.0).all():
+            if np.isnan(rho).any():
+                raise ValueError("NaN was given as a value of density, rho")
+            else:
+                raise ValueError("Density values cannot be negative.")
 
         return rho
 
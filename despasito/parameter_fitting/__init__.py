@@ -26,6 +26,7 @@ def fit(
     global_opts={},
     minimizer_opts=None,
     MultiprocessingObject=None,
+    reduced_precision=False,
     **kwargs
 ):
     r"""
@@ -64,6 +65,8 @@ def fit(
 
     MultiprocessingObject : obj, Optional
         Multiprocessing object, :class:`~despasito.utils.parallelization.MultiprocessingJob`
+    reduced_precision : bool, Optional, default=False
+        If True, equation of state objects with an ``eos_dtype`` attribute (e.g. SAFT) use single precision while the objective function is minimized. Afterwards, each ``eos_dtype`` is restored and the reported objective value is evaluated with it at the final parameters.
     kwargs : 
         Other keywords of instructions for thermodynamic calculations and parameter fitting.
   
@@ -169,17 +172,47 @@ def fit(
     else:
         global_method = "differential_evolution"
 
+    # Equation of state objects that support a reduced precision
+    eos_reduced_precision = []
+    if reduced_precision:
+        for instance in exp_dict.values():
+            if hasattr(instance.Eos, "eos_dtype") and not any(
+                instance.Eos is x for x in eos_reduced_precision
+            ):
+                eos_reduced_precision.append(instance.Eos)
+        if not eos_reduced_precision:
+            logger.warning(
+                "None of the equation of state objects support reduced precision"
+            )
+
     # Run Parameter Fitting
+    original_dtypes = [Eos_tmp.eos_dtype for Eos_tmp in eos_reduced_precision]
     try:
-        result = ff.global_minimization(
-            global_method,
-            parameters_guess,
-            bounds,
-            optimization_parameters["fit_bead"],
-            optimization_parameters["fit_parameter_names"],
-            exp_dict,
-            **dicts
-        )
+        try:
+            for Eos_tmp in eos_reduced_precision:
+                Eos_tmp.eos_dtype = np.float32
+
+            result = ff.global_minimization(
+                global_method,
+                parameters_guess,
+                bounds,
+                optimization_parameters["fit_bead"],
+                optimization_parameters["fit_parameter_names"],
+                exp_dict,
+                **dicts
+            )
+        finally:
+            for Eos_tmp, dtype in zip(eos_reduced_precision, original_dtypes):
+                Eos_tmp.eos_dtype = dtype
+
+        if eos_reduced_precision:
+            result.fun = ff.compute_obj(
+                result.x,
+                optimization_parameters["fit_bead"],
+                optimization_parameters["fit_parameter_names"],
+                exp_dict,
+                bounds,
+            )
 
         logger.info("Fitting terminated:\n{}".format(result.message))
         logger.info("Best Fit Parameters")
@@ -40,7 +40,7 @@ class Data(ExpDataTemplate):
         * xi(yi) (list) - List of liquid (or vapor) mole fractions used in bubble_pressure (or dew_pressure) calculation.
         * weights (dict) - A dictionary where each key is a system constraint (e.g. T or xi) which is also a header used in an optional exp. data file. The value associated with a header can be a list as long as the number of data points to multiply by the objective value associated with each point, or a float to multiply the objective value of this data set.
         * density_opts (dict) - Optional, default={}, Dictionary of options used in calculating pressure vs. mole fraction curves.
-        * kwargs for :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`
+        * kwargs for :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
 
     Attributes
     ----------
@@ -48,8 +48,8 @@ class Data(ExpDataTemplate):
         Data type, in this case TLVE
     Eos : obj
         Equation of state object
-    obj_opts : dict
-        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`.
+    obj_opts : ObjectiveOptions
+        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
     npoints : int
         Number of sets of system conditions this object computes
     result_keys : list
@@ -65,11 +65,12 @@ class Data(ExpDataTemplate):
   
     """
 
-    def __init__(self, data_dict):
+    __slots__ = ()
 
-        data_dict = data_dict.copy()
+    def __init__(self, data_dict):
 
         super().__init__(data_dict)
+        data_dict = self._remaining_data(data_dict)
 
         self.name = "TLVE"
         self.thermodict["density_opts"] = {}
@@ -114,10 +115,7 @@ class Data(ExpDataTemplate):
             )
         )
 
-        self.weights.update(
-            gtb.check_length_dict(self.weights, self.result_keys, lx=self.npoints)
-        )
-        self.weights.update(gtb.set_defaults(self.weights, self.result_keys, 1.0))
+        self._finalize_weights()
 
         if "Tlist" not in self.thermodict:
             raise ImportError(
@@ -212,11 +210,8 @@ class Data(ExpDataTemplate):
         obj_value = np.zeros(2)
 
         if "Plist" in self.thermodict:
-            obj_value[0] = ff.obj_function_form(
-                phase_list[0],
-                self.thermodict["Plist"],
-                weights=self.weights["Plist"],
-                **self.obj_opts
+            obj_value[0] = self._reduce_residuals(
+                phase_list[0], self.thermodict["Plist"], "Plist"
             )
 
         if self.thermodict["calculation_type"] == "bubble_pressure":
@@ -224,22 +219,16 @@ class Data(ExpDataTemplate):
                 yi = np.transpose(self.thermodict["yilist"])
                 obj_value[1] = 0
                 for i in range(len(yi)):
-                    obj_value[1] += ff.obj_function_form(
-                        phase_list[1 + i],
-                        yi[i],
-                        weights=self.weights["yilist"],
-                        **self.obj_opts
+                    obj_value[1] += self._reduce_residuals(
+                        phase_list[1 + i], yi[i], "yilist"
                     )
         elif self.thermodict["calculation_type"] == "dew_pressure":
             if "xilist" in self.thermodict:
                 xi = np.transpose(self.thermodict["xilist"])
                 obj_value[1] = 0
                 for i in range(len(xi)):
-                    obj_value[1] += ff.obj_function_form(
-                        phase_list[1 + i],
-                        xi[i],
-                        weights=self.weights["xilist"],
-                        **self.obj_opts
+                    obj_value[1] += self._reduce_residuals(
+                        phase_list[1 + i], xi[i], "xilist"
                     )
 
         logger.info(
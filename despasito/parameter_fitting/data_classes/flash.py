@@ -39,7 +39,7 @@ class Data(ExpDataTemplate):
         * yi (list) - List of vapor compositions
         * weights (dict) - A dictionary where each key is a system constraint (e.g. T or xi) which is also a header used in an optional exp. data file. The value associated with a header can be a list as long as the number of data points to multiply by the objective value associated with each point, or a float to multiply the objective value of this data set.
         * density_opts (dict) - Optional, default={"min_density_fraction":(1.0 / 300000.0), "density_increment":10.0, "max_volume_increment":1.0E-4}, Dictionary of options used in calculating pressure vs. mole fraction curves.
-        * kwargs for :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`
+        * kwargs for :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
 
     Attributes
     ----------
@@ -49,8 +49,8 @@ class Data(ExpDataTemplate):
         Equation of state object
     weights : dict, Optional, default: {"some_property": 1.0 ...}
         Dictionary with keys corresponding to those in thermodict, with weighting factor or vector for each system property used in fitting.
-    obj_opts : dict
-        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`.
+    obj_opts : ObjectiveOptions
+        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
     npoints : int
         Number of sets of system conditions this object computes
     result_keys : list
@@ -63,11 +63,12 @@ class Data(ExpDataTemplate):
     
     """
 
-    def __init__(self, data_dict):
+    __slots__ = ("_xi", "_yi")
 
-        data_dict = data_dict.copy()
+    def __init__(self, data_dict):
 
         super().__init__(data_dict)
+        data_dict = self._remaining_data(data_dict)
 
         self.name = "flash"
         if self.thermodict["calculation_type"] == None:
@@ -83,22 +84,18 @@ class Data(ExpDataTemplate):
             tmp.update(self.thermodict["density_opts"])
         self.thermodict["density_opts"] = tmp
 
-        if "xi" in data_dict:
-            self.thermodict["xilist"] = data_dict["xi"]
-            del data_dict["xi"]
-            if "xi" in self.weights:
-                self.weights["xilist"] = self.weights.pop("xi")
-        if "yi" in data_dict:
-            self.thermodict["yilist"] = data_dict["yi"]
-            del data_dict["yi"]
-            if "yi" in self.weights:
-                self.weights["yilist"] = self.weights.pop("yi")
-        if "T" in data_dict:
-            self.thermodict["Tlist"] = data_dict["T"]
-            del data_dict["T"]
-        if "P" in data_dict:
-            self.thermodict["Plist"] = data_dict["P"]
-            del data_dict["P"]
+        # Experimental data key, thermodict key, and whether the weights are renamed
+        fields = [
+            ("xi", "xilist", True),
+            ("yi", "yilist", True),
+            ("T", "Tlist", False),
+            ("P", "Plist", False),
+        ]
+        for key, thermo_key, flag_weight in fields:
+            if key in data_dict:
+                self.thermodict[thermo_key] = data_dict.pop(key)
+                if flag_weight and key in self.weights:
+                    self.weights[thermo_key] = self.weights.pop(key)
 
         self.thermodict.update(data_dict)
 
@@ -116,10 +113,7 @@ class Data(ExpDataTemplate):
             )
         )
 
-        self.weights.update(
-            gtb.check_length_dict(self.weights, self.result_keys, lx=self.npoints)
-        )
-        self.weights.update(gtb.set_defaults(self.weights, self.result_keys, 1.0))
+        self._finalize_weights()
 
         if "Plist" not in self.thermodict and "Tlist" not in self.thermodict:
             raise ImportError(
@@ -131,6 +125,14 @@ class Data(ExpDataTemplate):
                 "Given flash data, mole fractions should have been provided."
             )
 
+        # Experimental compositions as (Ncomp x npoints), so that each component is contiguous
+        self._yi = np.ascontiguousarray(
+            np.transpose(self.thermodict["yilist"]), dtype=float
+        )
+        self._xi = np.ascontiguousarray(
+            np.transpose(self.thermodict["xilist"]), dtype=float
+        )
+
         logger.info(
             "Data type 'flash' initiated with calculation_type, {}, and data types: {}.\nWeight data by: {}".format(
                 self.thermodict["calculation_type"],
@@ -179,30 +181,25 @@ class Data(ExpDataTemplate):
         # objective function
         phase_list = self._thermo_wrapper()
         phase_list, len_cluster = ff.reformat_output(phase_list)
-        phase_list = np.transpose(np.array(phase_list))
+        # Predicted compositions as (2*Ncomp x npoints), vapor followed by liquid
+        phase_list = np.ascontiguousarray(phase_list.T)
 
         obj_value = np.zeros(2)
 
         if "yilist" in self.thermodict:
-            yi = np.transpose(self.thermodict["yilist"])
+            yi = self._yi
             obj_value[0] = 0
             for i in range(len(yi)):
-                obj_value[0] += ff.obj_function_form(
-                    phase_list[i],
-                    yi[i],
-                    weights=self.weights["yilist"],
-                    **self.obj_opts
+                obj_value[0] += self._reduce_residuals(
+                    phase_list[i], yi[i], "yilist"
                 )
 
         if "xilist" in self.thermodict:
-            xi = np.transpose(self.thermodict["xilist"])
+            xi = self._xi
             obj_value[1] = 0
             for i in range(len(xi)):
-                obj_value[1] += ff.obj_function_form(
-                    phase_list[self.Eos.number_of_components + i],
-                    xi[i],
-                    weights=self.weights["xilist"],
-                    **self.obj_opts
+                obj_value[1] += self._reduce_residuals(
+                    phase_list[self.Eos.number_of_components + i], xi[i], "xilist"
                 )
 
         logger.info(
@@ -39,9 +39,9 @@ class Data(ExpDataTemplate):
         * xi (list) - List of liquid mole fractions used in liquid_properties calculations
         * rhol (list) - [mol/:math:`m^3`] Evaluated liquid density values
         * weights (dict) - A dictionary where each key is a system constraint (e.g. T or xi) which is also a header used in an optional exp. data file. The value associated with a header can be a list as long as the number of data points to multiply by the objective value associated with each point, or a float to multiply the objective value of this data set.
-        * objective_method (str) - The 'method' keyword in function despasito.parameter_fitting.fit_functions.obj_function_form.
+        * objective_method (str) - The 'method' keyword in function despasito.parameter_fitting.objective_forms.obj_function_form.
         * density_opts (dict) - Optional, default={"min_density_fraction":(1.0 / 60000.0), "density_increment":10.0, "max_volume_increment":1.0E-4}, Dictionary of options used in calculating pressure vs. mole fraction curves.
-        * kwargs for :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`
+        * kwargs for :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
 
     Attributes
     ----------
@@ -51,8 +51,8 @@ class Data(ExpDataTemplate):
         Equation of state object
     weights : dict, Optional, default: {"some_property": 1.0 ...}
         Dictionary with keys corresponding to those in thermodict, with weighting factor or vector for each system property used in fitting
-    obj_opts : dict
-        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`.
+    obj_opts : ObjectiveOptions
+        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
     npoints : int
         Number of sets of system conditions this object computes
     result_keys : list
@@ -65,11 +65,12 @@ class Data(ExpDataTemplate):
         
     """
 
-    def __init__(self, data_dict):
+    __slots__ = ()
 
-        data_dict = data_dict.copy()
+    def __init__(self, data_dict):
 
         super().__init__(data_dict)
+        data_dict = self._remaining_data(data_dict)
 
         self.name = "liquid_density"
         tmp = {
@@ -116,10 +117,7 @@ class Data(ExpDataTemplate):
             )
         )
 
-        self.weights.update(
-            gtb.check_length_dict(self.weights, self.result_keys, lx=self.npoints)
-        )
-        self.weights.update(gtb.set_defaults(self.weights, self.result_keys, 1.0))
+        self._finalize_weights()
 
         if "Tlist" not in self.thermodict and "rhol" not in self.thermodict:
             raise ImportError(
@@ -177,11 +175,8 @@ class Data(ExpDataTemplate):
         phase_list = np.transpose(np.array(phase_list))
 
         # objective function
-        obj_value = ff.obj_function_form(
-            phase_list,
-            self.thermodict["rhol"],
-            weights=self.weights["rhol"],
-            **self.obj_opts
+        obj_value = self._reduce_residuals(
+            phase_list, self.thermodict["rhol"], "rhol"
         )
 
         logger.info("Obj. breakdown for {}: rhol {}".format(self.name, obj_value))
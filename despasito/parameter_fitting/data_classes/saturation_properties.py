@@ -41,7 +41,7 @@ class Data(ExpDataTemplate):
         * rhol (list) - [mol/:math:`m^3`] List of liquid density values
         * weights (dict) - A dictionary where each key is a system constraint (e.g. T or xi) which is also a header used in an optional exp. data file. The value associated with a header can be a list as long as the number of data points to multiply by the objective value associated with each point, or a float to multiply the objective value of this data set.
         * density_opts (dict) - Optional, default={"min_density_fraction":(1.0 / 60000.0), "density_increment":10.0, "max_volume_increment":1.0E-4}, Dictionary of options used in calculating pressure vs. mole fraction curves.
-        * kwargs for :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`
+        * kwargs for :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
 
     Attributes
     ----------
@@ -49,8 +49,8 @@ class Data(ExpDataTemplate):
         Data type, in this case saturation_properties
     Eos : obj
         Equation of state object
-    obj_opts : dict
-        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`.
+    obj_opts : ObjectiveOptions
+        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
     npoints : int
         Number of sets of system conditions this object computes
     result_keys : list
@@ -66,11 +66,12 @@ class Data(ExpDataTemplate):
         
     """
 
-    def __init__(self, data_dict):
+    __slots__ = ()
 
-        data_dict = data_dict.copy()
+    def __init__(self, data_dict):
 
         super().__init__(data_dict)
+        data_dict = self._remaining_data(data_dict)
 
         # If required items weren't defined, set defaults
         self.name = "saturation_properties"
@@ -138,10 +139,7 @@ class Data(ExpDataTemplate):
             )
         )
 
-        self.weights.update(
-            gtb.check_length_dict(self.weights, self.result_keys, lx=self.npoints)
-        )
-        self.weights.update(gtb.set_defaults(self.weights, self.result_keys, 1.0))
+        self._finalize_weights()
 
         if "Tlist" not in self.thermodict:
             raise ImportError(
@@ -209,25 +207,16 @@ class Data(ExpDataTemplate):
         # objective function
         obj_value = np.zeros(3)
         if "Psat" in self.thermodict:
-            obj_value[0] = ff.obj_function_form(
-                phase_list[0],
-                self.thermodict["Psat"],
-                weights=self.weights["Psat"],
-                **self.obj_opts
+            obj_value[0] = self._reduce_residuals(
+                phase_list[0], self.thermodict["Psat"], "Psat"
             )
         if "rhol" in self.thermodict:
-            obj_value[1] = ff.obj_function_form(
-                phase_list[1],
-                self.thermodict["rhol"],
-                weights=self.weights["rhol"],
-                **self.obj_opts
+            obj_value[1] = self._reduce_residuals(
+                phase_list[1], self.thermodict["rhol"], "rhol"
             )
         if "rhov" in self.thermodict:
-            obj_value[2] = ff.obj_function_form(
-                phase_list[2],
-                self.thermodict["rhov"],
-                weights=self.weights["rhov"],
-                **self.obj_opts
+            obj_value[2] = self._reduce_residuals(
+                phase_list[2], self.thermodict["rhov"], "rhov"
             )
 
         logger.info(
@@ -8,6 +8,8 @@ from scipy.optimize import NonlinearConstraint, LinearConstraint
 
 from . import constraint_types as constraints_mod
 from . import global_methods as global_methods_mod
+from .interface import ExpDataTemplate, parse_parameter_names, refresh_batch
+from .objective_forms import obj_function_form
 import despasito.utils.general_toolbox as gtb
 
 logger = logging.getLogger(__name__)
@@ -37,24 +39,13 @@ def initial_guess(optimization_parameters, Eos):
 
     # Update bead_library with test parameters
 
-    parameters_guess = np.ones(len(optimization_parameters["fit_parameter_names"]))
-    for i, param in enumerate(optimization_parameters["fit_parameter_names"]):
-        fit_parameter_names_list = param.split("_")
-        if len(fit_parameter_names_list) == 1:
-            parameters_guess[i] = Eos.guess_parameters(
-                fit_parameter_names_list[0], [optimization_parameters["fit_bead"]]
-            )
-        elif len(fit_parameter_names_list) == 2:
-            parameters_guess[i] = Eos.guess_parameters(
-                fit_parameter_names_list[0],
-                [optimization_parameters["fit_bead"], fit_parameter_names_list[1]],
-            )
-        else:
-            raise ValueError(
-                "Parameters for only one bead are allowed to be fit. Multiple underscores in a parameter name suggest more than one bead type in your fit parameter name, {}".format(
-                    param
-                )
-            )
+    plan = parse_parameter_names(
+        optimization_parameters["fit_bead"],
+        optimization_parameters["fit_parameter_names"],
+    )
+    parameters_guess = np.ones(len(plan))
+    for i, (param, bead_names) in enumerate(plan):
+        parameters_guess[i] = Eos.guess_parameters(param, bead_names)
 
     return parameters_guess
 
@@ -87,10 +78,8 @@ def check_parameter_bounds(optimization_parameters, Eos, bounds):
     ]
     # Check boundary parameters to be sure they're in a reasonable range
     for i, param in enumerate(optimization_parameters["fit_parameter_names"]):
-        fit_parameter_names_list = param.split("_")
-        new_bounds[i] = tuple(
-            Eos.check_bounds(fit_parameter_names_list[0], param, bounds[i])
-        )
+        param_type = param.partition("_")[0]
+        new_bounds[i] = tuple(Eos.check_bounds(param_type, param, bounds[i]))
 
     return new_bounds
 
@@ -415,11 +404,33 @@ def compute_obj(beadparams, fit_bead, fit_parameter_names, exp_dict, bounds, fro
 
     # Compute obj_function
     if not np.any(np.isnan(beadparams)):
+        # Update all data sets first so that each unique Eos object is refreshed once
+        failed = set()
+        try:
+            with refresh_batch():
+                for key, data_obj in exp_dict.items():
+                    try:
+                        data_obj.update_parameters(
+                            fit_bead, fit_parameter_names, beadparams
+                        )
+                    except Exception:
+                        logger.exception(
+                            "Failed to update parameters for {} of type {}.".format(
+                                key, data_obj.name
+                            )
+                        )
+                        failed.add(key)
+        except Exception:
+            logger.exception("Failed to refresh Eos parameters.")
+            failed.update(exp_dict)
+
         obj_function = []
         for key, data_obj in exp_dict.items():
+            if key in failed:
+                obj_function.append(np.inf)
+                continue
             try:
-                data_obj.update_parameters(fit_bead, fit_parameter_names, beadparams)
-                obj_function.append(data_obj.objective())
+                obj_function.append(data_obj.objective_cached(beadparams))
             except Exception:
                 logger.exception(
                     "Failed to evaluate objective function for {} of type {}.".format(
@@ -468,117 +479,88 @@ def compute_obj(beadparams, fit_bead, fit_parameter_names, exp_dict, bounds, fro
     return obj_total
 
 
-def obj_function_form(
-    data_test,
-    data0,
-    weights=1.0,
-    method="average-squared-deviation",
-    nan_number=1000,
-    nan_ratio=0.1,
-):
-    """
-    Sets objective functional form 
-
-    Note that if the result is np.nan, that point is removed from the list for the purposes of averaging.
+def provides_gradient(exp_dict):
+    r"""
+    Check whether every data set provides the gradient of its objective.
 
     Parameters
     ----------
-    data_test : numpy.ndarray
-        Data that is being assessed. Array of data of the same length as ``data_test``
-    data0 : numpy.ndarray
-        Reference data for comparison
-    weights : (numpy.ndarray or float), Optional, default=1.0
-        Can be a float or array of data of the same length as ``data_test``. Allows the user to tune the importance of various data points.
-    method : str, Optional, default="mean-squared-relative-error"
-        Keyword used to choose the functional form. Can be:
-
-        - average-squared-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}/N`
-        - sum-squared-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}`
-        - sum-squared-deviation-boltz: :math:`\sum{(\\frac{data\_test-data0}{data0})^2 exp(\\frac{data\_test\_min-data\_test}{|data\_test\_min|})}` [DOI: 10.1063/1.2181979]
-        - sum-deviation-boltz: :math:`\sum{\\frac{data\_test-data0}{data0} exp(\\frac{data\_test\_min-data\_test}{|data\_test\_min|})}` [DOI: 10.1063/1.2181979]
-        - percent-absolute-average-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}/N \\times 100`
-
-    nan_ratio : float, Optional, default=0.1
-        If more than "nan_ratio*100" percent of the calculated data failed to produce NaN, increase the objective value by the number of entries where data_test is NaN times ``nan_number``.
-    nan_number : float, Optional, default=1000
-        If a thermodynamic calculation produces NaN, add this quantity to the objective value. (See nan_ratio)
+    exp_dict : dict
+        Dictionary of experimental data objects.
 
     Returns
     -------
-    obj_value : float
-        Objective value given the calculated and reference information
+    flag : bool
+        True if every data object overrides :meth:`~despasito.parameter_fitting.interface.ExpDataTemplate.gradient`
     """
 
-    if np.size(data0) != np.size(data_test):
-        raise ValueError(
-            "Input data of length, {}, must be the same length as reference data of length {}".format(
-                len(data_test), len(data0)
-            )
-        )
-
-    if np.size(weights) > 1 and np.size(weights) != np.size(data_test):
-        raise ValueError(
-            "Weight for data is provided as an array of length, {}, but must be length, {}.".format(
-                len(weights), len(data_test)
-            )
-        )
-
-    data_tmp = np.array(
-        [
-            (data_test[i] - data0[i]) / data0[i]
-            for i in range(len(data_test))
-            if not np.isnan((data_test[i] - data0[i]) / data0[i])
-        ]
+    return len(exp_dict) > 0 and all(
+        getattr(type(data_obj), "gradient", ExpDataTemplate.gradient)
+        is not ExpDataTemplate.gradient
+        for data_obj in exp_dict.values()
     )
-    if gtb.isiterable(weights):
-        weight_tmp = np.array(
-            [
-                weights[i]
-                for i in range(len(data_test))
-                if not np.isnan((data_test[i] - data0[i]) / data0[i])
-            ]
-        )
-    else:
-        weight_tmp = weights
-
-    if method == "average-squared-deviation":
-        obj_value = np.mean(data_tmp ** 2 * weight_tmp)
 
-    elif method == "sum-squared-deviation":
-        obj_value = np.sum(data_tmp ** 2 * weight_tmp)
 
-    elif method == "sum-squared-deviation-boltz":
-        data_min = np.min(data_tmp)
-        obj_value = np.sum(
-            data_tmp ** 2 * weight_tmp * np.exp((data_min - data_tmp) / np.abs(data_min))
-        )
+def compute_gradient(beadparams, fit_bead, fit_parameter_names, exp_dict, bounds, frozen_parameters=None):
+    r"""
+    Gradient of :func:`compute_obj` with respect to the parameters being fit.
 
-    elif method == "sum-deviation-boltz":
-        data_min = np.min(data_tmp)
-        obj_value = np.sum(
-            data_tmp * weight_tmp * np.exp((data_min - data_tmp) / np.abs(data_min))
-        )
+    Each data set must provide its gradient with :meth:`~despasito.parameter_fitting.interface.ExpDataTemplate.gradient`, see :func:`provides_gradient`.
 
-    elif method == "percent-absolute-average-deviation":
-        obj_value = np.mean(np.abs(data_tmp) * weight_tmp) * 100
+    Parameters
+    ----------
+    beadparams : numpy.ndarray
+        An array of parameters at which the gradient is evaluated.
+    fit_bead : str
+        Name of bead whose parameters are being fit.
+    fit_parameter_names : list[str]
+        This list contains the name of the parameter being fit (e.g. epsilon). See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
+    exp_dict : dict
+        Dictionary of experimental data objects.
+    bounds : list[tuple]
+        List of length equal to fit_parameter_names with lists of pairs containing minimum and maximum bounds of parameters being fit.
+    frozen_parameters : numpy.ndarray, Optional, default=None
+        List of first parameters in the fit_parameter_names list that are frozen during minimization. The gradient of these parameters is not returned.
 
-    if len(data_tmp) == 0:
-        obj_value = np.nan
+    Returns
+    -------
+    gradient : numpy.ndarray
+        Gradient of the objective, or an array of NaN if a data set failed to evaluate
+    """
 
-    if len(data_test) != len(data_tmp):
-        tmp = 1 - len(data_tmp) / len(data_test)
-        if tmp > nan_ratio:
-            obj_value += (len(data_test) - len(data_tmp)) * nan_number
-            logger.debug(
-                "Values of NaN were removed from objective value calculation, nan_ratio {} > {}, augment obj. value".format(
-                    tmp, nan_ratio
-                )
-            )
+    nfrozen = 0
+    if len(beadparams) != len(fit_parameter_names):
+        if np.any(frozen_parameters != None):
+            nfrozen = len(frozen_parameters)
+            beadparams = np.array(list(frozen_parameters) + list(beadparams))
         else:
-            logger.debug(
-                "Values of NaN were removed from objective value calculation, nan_ratio {} < {}".format(
-                    tmp, nan_ratio
-                )
+            raise ValueError(
+                "The length of initial guess vector should be the same number of parameters to be fit."
             )
 
-    return obj_value
+    gradient = np.zeros(len(beadparams))
+    try:
+        with refresh_batch():
+            for data_obj in exp_dict.values():
+                data_obj.update_parameters(fit_bead, fit_parameter_names, beadparams)
+        for key, data_obj in exp_dict.items():
+            tmp = data_obj.gradient()
+            if tmp is None:
+                raise ValueError(
+                    "Data set, {}, of type {} does not provide a gradient.".format(
+                        key, data_obj.name
+                    )
+                )
+            gradient += tmp
+    except Exception:
+        logger.exception("Failed to evaluate gradient of objective function.")
+        return np.nan * np.ones(len(beadparams) - nfrozen)
+
+    # Derivative of penalty for being out of bounds in compute_obj
+    for i, param in enumerate(beadparams):
+        if param < bounds[i][0]:
+            gradient[i] += 8e3 * (1e3 * (param - bounds[i][0])) ** 7
+        elif param > bounds[i][1]:
+            gradient[i] += 8e3 * (1e3 * (param - bounds[i][1])) ** 7
+
+    return gradient[nfrozen:]
@@ -546,7 +546,7 @@ def basinhopping(
     minimizer_opts : dict, Optional, default={}
         Dictionary used to define minimization type and the associated options.
 
-        - method (str) - Method available to scipy.optimize.minimize
+        - method (str) - Optional, default="nelder-mead", Method available to scipy.optimize.minimize. If every data set provides a gradient, it's given as ``jac`` and the default is "CG".
         - options (dict) - This dictionary contains the kwargs available to the chosen method
 
     Returns
@@ -590,6 +590,7 @@ def basinhopping(
     global_opts = new_global_opts
 
     # Set up options for minimizer in basin hopping
+    flag_method = minimizer_opts is not None and "method" in minimizer_opts
     new_minimizer_opts = {"method": "nelder-mead", "options": {"maxiter": 50}}
     if minimizer_opts:
         for key, value in minimizer_opts.items():
@@ -600,6 +601,12 @@ def basinhopping(
                     new_minimizer_opts[key][key2] = value2
     minimizer_opts = new_minimizer_opts
 
+    # Use gradient based minimization if every data set provides a gradient
+    if ff.provides_gradient(exp_dict):
+        minimizer_opts["jac"] = ff.compute_gradient
+        if not flag_method:
+            minimizer_opts["method"] = "CG"
+
     try:
         if "stepsize" in global_opts:
             stepsize = global_opts["stepsize"]
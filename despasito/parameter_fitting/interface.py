@@ -4,10 +4,97 @@
 # All folders in this directory refer back to this interface
 import numpy as np
 import logging
+import weakref
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from contextlib import contextmanager
+
+from .objective_forms import obj_function_form
+import despasito.utils.general_toolbox as gtb
 
 logger = logging.getLogger(__name__)
 
+# Placeholder for optional entries missing from data_dict
+_MISSING = object()
+
+# Keywords of obj_function_form, with its defaults
+ObjectiveOptions = namedtuple(
+    "ObjectiveOptions",
+    ["method", "nan_number", "nan_ratio"],
+    defaults=["average-squared-deviation", 1000, 0.1],
+)
+
+# Eos objects awaiting "parameter_refresh" in the active refresh_batch, and the data sets that updated them
+_REFRESH_TOKENS = weakref.WeakKeyDictionary()
+_refresh_batch_depth = 0
+
+
+@contextmanager
+def refresh_batch():
+    r"""
+    Defer the Eos method, "parameter_refresh", triggered by :meth:`ExpDataTemplate.update_parameters` until the end of the block.
+
+    When many data sets share an Eos object, each unique Eos object is then refreshed once, rather than once per data set. Objectives should be evaluated after the block exits. Batches may be nested, in which case the refresh occurs when the outermost batch exits.
+
+    If a refresh fails, the data sets that updated that Eos object will push their parameters again on their next update, and the first exception is raised once all Eos objects have been attempted.
+    """
+
+    global _refresh_batch_depth
+
+    _refresh_batch_depth += 1
+    try:
+        yield
+    finally:
+        _refresh_batch_depth -= 1
+        if _refresh_batch_depth == 0:
+            pending = list(_REFRESH_TOKENS.items())
+            _REFRESH_TOKENS.clear()
+            error = None
+            for Eos, data_sets in pending:
+                try:
+                    Eos.parameter_refresh()
+                except Exception as exc:
+                    for data_set in data_sets:
+                        data_set._last_param_cache = {}
+                    if error is None:
+                        error = exc
+            if error is not None:
+                raise error
+
+
+def parse_parameter_names(fit_bead, param_names):
+    r"""
+    Split parameter names into the parameter type and the beads involved.
+
+    Names are validated here, so that a fit with malformed parameter names fails before any evaluation.
+
+    Parameters
+    ----------
+    fit_bead : str
+        Name of bead being fit
+    param_names : list
+        Parameters to be fit. See EOS documentation for supported parameter names. Cross interaction parameter names should be composed of parameter name and the other bead type, separated by an underscore (e.g. epsilon_CO2).
+
+    Returns
+    -------
+    plan : list[tuple]
+        For each parameter, a tuple of the parameter type and a tuple of bead names
+    """
+
+    plan = []
+    for param in param_names:
+        param_type, sep, bead = param.partition("_")
+        if "_" in bead:
+            raise ValueError(
+                "Parameters for only one bead are allowed to be fit. Multiple underscores in a parameter name suggest more than one bead type in your fit parameter name, {}".format(
+                    param
+                )
+            )
+        bead_names = (fit_bead, bead) if sep else (fit_bead,)
+        plan.append((param_type, bead_names))
+
+    return plan
+
 
 class ExpDataTemplate(ABC):
     r"""
@@ -24,7 +111,7 @@ class ExpDataTemplate(ABC):
         * weights (dict) - A dictionary where each key is the header used in the exp. data file. The value associated with a header can be a list as long as the number of data points to multiply by the objective value associated with each point, or a float to multiply the objective value of this data set.
         * density_opts (dict) - Optional, default={}, Dictionary of options used in calculating pressure vs. mole fraction curves.
         * Allowed property keys and associated values
-        * kwargs for :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`
+        * kwargs for :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
 
     Attributes
     ----------
@@ -34,8 +121,8 @@ class ExpDataTemplate(ABC):
         Equation of state object
     weights : dict, Optional, default: {"some_property": 1.0 ...}
         Dictionary corresponding to thermo_dict, with weighting factor or vector for each system property used in fitting
-    obj_opts : dict
-        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.fit_functions.obj_function_form`.
+    obj_opts : ObjectiveOptions
+        Keywords to compute the objective function with :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
     npoints : int
         Number of sets of system conditions this object computes
     thermodict : dict
@@ -46,49 +133,97 @@ class ExpDataTemplate(ABC):
   
     """
 
+    __slots__ = (
+        "name",
+        "Eos",
+        "_parameter_refresh",
+        "_update_eos_parameters",
+        "weights",
+        "obj_opts",
+        "npoints",
+        "result_keys",
+        "thermodict",
+        "_param_plan_key",
+        "_param_plan",
+        "_last_param_cache",
+        "_obj_cache",
+        "__weakref__",
+    )
+
+    # Entries of data_dict for the objective function options and their keywords in obj_function_form
+    _fitting_opts = {
+        "objective_method": "method",
+        "nan_number": "nan_number",
+        "nan_ratio": "nan_ratio",
+    }
+    # Entries of data_dict copied to thermodict
+    _thermo_dict_keys = ("MultiprocessingObject", "density_opts", "calculation_type")
+
     def __init__(self, data_dict):
 
         # Self interaction parameters
         self.name = "To be set"
 
-        if "eos_obj" in data_dict:
-            self.Eos = data_dict["eos_obj"]
-            del data_dict["eos_obj"]
-        else:
+        # data_dict is only read, so a single dict may be used to construct several data sets
+        self.Eos = data_dict.get("eos_obj", _MISSING)
+        if self.Eos is _MISSING:
             raise ValueError("An Eos object should have been included")
+        # Not all Eos objects have dependent parameters to refresh
+        self._parameter_refresh = getattr(self.Eos, "parameter_refresh", None)
+        self._update_eos_parameters = getattr(self.Eos, "update_parameters", None)
 
-        if "weights" in data_dict:
-            self.weights = data_dict["weights"]
-            del data_dict["weights"]
-        else:
-            self.weights = {}
+        self.weights = dict(data_dict.get("weights", {}))
+
+        obj_opts = {}
+        for key, opt in self._fitting_opts.items():
+            value = data_dict.get(key, _MISSING)
+            if value is not _MISSING:
+                obj_opts[opt] = value
+        self.obj_opts = ObjectiveOptions(**obj_opts)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Objective function options: %s", self.obj_opts)
 
-        self.obj_opts = {}
-        if "objective_method" in data_dict:
-            self.obj_opts["method"] = data_dict["objective_method"]
-            del data_dict["objective_method"]
-        fitting_opts = ["nan_number", "nan_ratio"]
-        for key in fitting_opts:
-            if key in data_dict:
-                self.obj_opts[key] = data_dict[key]
-                del data_dict[key]
-        logger.info("Objective function options: {}".format(self.obj_opts))
+        self.npoints = 0
 
-        self.npoints = np.nan
+        # Parsed parameter names and values last pushed to the Eos object by this data set
+        self._param_plan_key = None
+        self._param_plan = None
+        self._last_param_cache = {}
+        # Objective values of recently evaluated parameters
+        self._obj_cache = {}
 
         # Add to thermo_dict
         self.thermodict = {"calculation_type": None}
-        thermo_dict_keys = ["MultiprocessingObject", "density_opts", "calculation_type"]
-        for key in thermo_dict_keys:
-            if key in data_dict:
-                self.thermodict[key] = data_dict[key]
-                del data_dict[key]
+        for key in self._thermo_dict_keys:
+            value = data_dict.get(key, _MISSING)
+            if value is not _MISSING:
+                self.thermodict[key] = value
+
+    def _remaining_data(self, data_dict):
+        r"""
+        Copy of ``data_dict`` without the entries handled by :class:`ExpDataTemplate`.
+
+        Parameters
+        ----------
+        data_dict : dict
+            Dictionary of exp data given to the constructor
+
+        Returns
+        -------
+        remaining_dict : dict
+            Entries for the subclass to process
+        """
+
+        template_keys = {"eos_obj", "weights", *self._fitting_opts, *self._thermo_dict_keys}
+        return {
+            key: value for key, value in data_dict.items() if key not in template_keys
+        }
 
     def update_parameters(self, fit_bead, param_names, param_values):
         r"""
-        Update a single parameter value during parameter fitting process.
+        Update parameter values during parameter fitting process.
 
-        To refresh those parameters that are dependent on to bead_library or cross_library, use method "parameter refresh".
+        All parameters are updated before those parameters that are dependent on bead_library or cross_library are refreshed with the Eos method, "parameter_refresh". Within :func:`refresh_batch`, the refresh is deferred until the batch exits. Only parameter values that differ from those last pushed by this data set are updated, and if none differ the Eos object is not refreshed.
         
         Parameters
         ----------
@@ -101,32 +236,117 @@ class ExpDataTemplate(ABC):
             
         """
 
-        for i, param in enumerate(param_names):
-            bead_names = [fit_bead]
-            fit_parameter_names_list = param.split("_")
-            param = fit_parameter_names_list[0]
-            if len(fit_parameter_names_list) > 1:
-                bead_names.append(fit_parameter_names_list[1])
+        # Parameter names are only parsed when they change, typically once per fit
+        key = (fit_bead, tuple(param_names))
+        if key != self._param_plan_key:
+            self._param_plan = parse_parameter_names(fit_bead, param_names)
+            self._param_plan_key = key
+            self._last_param_cache = {}
 
-            if len(fit_parameter_names_list) == 1:
-                self.Eos.update_parameter(
-                    fit_parameter_names_list[0], [fit_bead], param_values[i]
-                )
-            elif len(fit_parameter_names_list) == 2:
-                self.Eos.update_parameter(
-                    fit_parameter_names_list[0],
-                    [fit_bead, fit_parameter_names_list[1]],
-                    param_values[i],
-                )
+        param_cache = dict(zip(self._param_plan, param_values))
+        if param_cache == self._last_param_cache:
+            return
+
+        # Only values that changed since the last update by this data set are pushed,
+        # and bead names are passed as the tuples stored in the plan
+        last_param_cache = self._last_param_cache
+        updates = [
+            (param, bead_names, value)
+            for (param, bead_names), value in param_cache.items()
+            if last_param_cache.get((param, bead_names), _MISSING) != value
+        ]
+
+        if self._update_eos_parameters is not None:
+            self._update_eos_parameters(updates)
+        else:
+            update_parameter = self.Eos.update_parameter
+            for param, bead_names, value in updates:
+                update_parameter(param, bead_names, value)
+
+        if self._parameter_refresh is not None:
+            if _refresh_batch_depth:
+                _REFRESH_TOKENS.setdefault(self.Eos, []).append(self)
             else:
-                raise ValueError(
-                    "Parameters for only one bead are allowed to be fit. Multiple underscores in a parameter name suggest more than one bead type in your fit parameter name, {}".format(
-                        param
-                    )
-                )
+                self._parameter_refresh()
+
+        self._last_param_cache = param_cache
+
+    def _finalize_weights(self):
+        """ Store the weights of each entry in ``self.result_keys`` as a C-contiguous array of floats of length ``self.npoints``.
+
+        Keys without a provided weight default to 1.0. Subclasses call this once ``self.result_keys`` and ``self.npoints`` are set, so the arrays can be passed directly to :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`.
+        """
 
-        if hasattr(self.Eos, "parameter_refresh"):
-            self.Eos.parameter_refresh()
+        self.weights.update(
+            gtb.check_length_dict(self.weights, self.result_keys, lx=self.npoints)
+        )
+        for key in self.result_keys:
+            weight = np.asarray(self.weights.get(key, 1.0), dtype=float).reshape(-1)
+            if weight.size == 1:
+                self.weights[key] = np.full(self.npoints, weight[0])
+            else:
+                self.weights[key] = np.ascontiguousarray(weight)
+
+    def _reduce_residuals(self, data_test, data0, weight_key):
+        r"""
+        Objective value from comparing calculated data to reference data with the options in ``self.obj_opts``.
+
+        Parameters
+        ----------
+        data_test : numpy.ndarray
+            Calculated data that is being assessed
+        data0 : numpy.ndarray
+            Reference data for comparison
+        weight_key : str
+            Key in ``self.weights`` for the weights of this property
+
+        Returns
+        -------
+        obj_value : float
+            Objective value from :func:`~despasito.parameter_fitting.objective_forms.obj_function_form`
+        """
+
+        opts = self.obj_opts
+        return obj_function_form(
+            data_test,
+            data0,
+            self.weights[weight_key],
+            method=opts.method,
+            nan_number=opts.nan_number,
+            nan_ratio=opts.nan_ratio,
+        )
+
+    def objective_cached(self, param_values):
+        r"""
+        Objective value for the current parameters, reusing the value if the same parameters were recently evaluated.
+
+        Parameters should first be applied with :meth:`update_parameters`.
+
+        Parameters
+        ----------
+        param_values : list
+            Value of parameters given to :meth:`update_parameters`
+
+        Returns
+        -------
+        obj_value : float
+            Objective value from :meth:`objective`
+        """
+
+        key = (
+            self._param_plan_key,
+            getattr(self.Eos, "eos_dtype", None),
+            np.asarray(param_values, dtype=float).tobytes(),
+        )
+        if key in self._obj_cache:
+            return self._obj_cache[key]
+
+        obj_value = self.objective()
+        if len(self._obj_cache) >= 64:
+            self._obj_cache.clear()
+        self._obj_cache[key] = obj_value
+
+        return obj_value
 
     @abstractmethod
     def objective(self):
@@ -134,6 +354,13 @@ class ExpDataTemplate(ABC):
         """
         pass
 
+    def gradient(self):
+        """ Gradient of :meth:`objective` with respect to the parameter values last given to :meth:`update_parameters`, or None if not available.
+
+        Subclasses may override this with analytic derivatives, or with finite differences that reuse the cached state of the Eos object. If every data set in a fit provides a gradient, it's given to gradient based minimizers as ``jac``, see :func:`~despasito.parameter_fitting.fit_functions.compute_gradient`.
+        """
+        return None
+
     def __str__(self):
 
         string = "Data Set Object\nName: {}\nCalculation_type: {}\nNumber of Points: {}".format(
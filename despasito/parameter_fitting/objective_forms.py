@@ -0,0 +1,175 @@
+""" Functional forms used to reduce calculated and reference data to an objective value.
+
+This module imports neither :mod:`~despasito.parameter_fitting.interface` nor :mod:`~despasito.parameter_fitting.fit_functions`, so both may import it.
+"""
+
+import numpy as np
+import logging
+import functools
+
+logger = logging.getLogger(__name__)
+
+
+_residual_methods = {
+    "average-squared-deviation": 0,
+    "sum-squared-deviation": 1,
+    "sum-squared-deviation-boltz": 2,
+    "sum-deviation-boltz": 3,
+    "percent-absolute-average-deviation": 4,
+}
+
+
+def _residual_kernel(data_test, data0, weights, method_id):
+    """
+    Reduce the relative deviation of ``data_test`` from ``data0`` to an objective value, skipping NaN entries.
+
+    Parameters
+    ----------
+    data_test : numpy.ndarray
+        Data that is being assessed
+    data0 : numpy.ndarray
+        Reference data for comparison, of the same length as ``data_test``
+    weights : numpy.ndarray
+        Weight of each data point, of the same length as ``data_test``
+    method_id : int
+        Index of the functional form in ``_residual_methods``
+
+    Returns
+    -------
+    obj_value : float
+        Objective value from the entries that aren't NaN, or NaN if all entries are NaN
+    npoints : int
+        Number of entries used to compute the objective value
+    """
+
+    npoints = 0
+    deviation = np.empty(len(data_test))
+    weight = np.empty(len(data_test))
+    for i in range(len(data_test)):
+        tmp = (data_test[i] - data0[i]) / data0[i]
+        if not np.isnan(tmp):
+            deviation[npoints] = tmp
+            weight[npoints] = weights[i]
+            npoints += 1
+
+    if npoints == 0:
+        return np.nan, npoints
+
+    deviation = deviation[:npoints]
+    weight = weight[:npoints]
+    if method_id == 0:
+        obj_value = np.mean(deviation ** 2 * weight)
+    elif method_id == 1:
+        obj_value = np.sum(deviation ** 2 * weight)
+    elif method_id == 4:
+        obj_value = np.mean(np.abs(deviation) * weight) * 100
+    else:
+        data_min = np.min(deviation)
+        boltz = np.exp((data_min - deviation) / np.abs(data_min))
+        if method_id == 2:
+            obj_value = np.sum(deviation ** 2 * weight * boltz)
+        else:
+            obj_value = np.sum(deviation * weight * boltz)
+
+    return obj_value, npoints
+
+
+@functools.lru_cache(maxsize=None)
+def _get_residual_kernel():
+    """ Numba compiled :func:`_residual_kernel`, compiled on first use and cached on disk.
+    """
+
+    from numba import njit
+
+    return njit(cache=True, error_model="numpy")(_residual_kernel)
+
+
+def obj_function_form(
+    data_test,
+    data0,
+    weights=1.0,
+    method="average-squared-deviation",
+    nan_number=1000,
+    nan_ratio=0.1,
+):
+    """
+    Sets objective functional form 
+
+    Note that if the result is np.nan, that point is removed from the list for the purposes of averaging.
+
+    Parameters
+    ----------
+    data_test : numpy.ndarray
+        Data that is being assessed. Array of data of the same length as ``data_test``
+    data0 : numpy.ndarray
+        Reference data for comparison
+    weights : (numpy.ndarray or float), Optional, default=1.0
+        Can be a float or array of data of the same length as ``data_test``. Allows the user to tune the importance of various data points.
+    method : str, Optional, default="mean-squared-relative-error"
+        Keyword used to choose the functional form. Can be:
+
+        - average-squared-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}/N`
+        - sum-squared-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}`
+        - sum-squared-deviation-boltz: :math:`\sum{(\\frac{data\_test-data0}{data0})^2 exp(\\frac{data\_test\_min-data\_test}{|data\_test\_min|})}` [DOI: 10.1063/1.2181979]
+        - sum-deviation-boltz: :math:`\sum{\\frac{data\_test-data0}{data0} exp(\\frac{data\_test\_min-data\_test}{|data\_test\_min|})}` [DOI: 10.1063/1.2181979]
+        - percent-absolute-average-deviation: :math:`\sum{(\\frac{data\_test-data0}{data0})^2}/N \\times 100`
+
+    nan_ratio : float, Optional, default=0.1
+        If more than "nan_ratio*100" percent of the calculated data failed to produce NaN, increase the objective value by the number of entries where data_test is NaN times ``nan_number``.
+    nan_number : float, Optional, default=1000
+        If a thermodynamic calculation produces NaN, add this quantity to the objective value. (See nan_ratio)
+
+    Returns
+    -------
+    obj_value : float
+        Objective value given the calculated and reference information
+    """
+
+    if np.size(data0) != np.size(data_test):
+        raise ValueError(
+            "Input data of length, {}, must be the same length as reference data of length {}".format(
+                len(data_test), len(data0)
+            )
+        )
+
+    if np.size(weights) > 1 and np.size(weights) != np.size(data_test):
+        raise ValueError(
+            "Weight for data is provided as an array of length, {}, but must be length, {}.".format(
+                len(weights), len(data_test)
+            )
+        )
+
+    if method not in _residual_methods:
+        raise ValueError(
+            "Objective method, {}, is not supported. Select from: {}".format(
+                method, ", ".join(_residual_methods)
+            )
+        )
+
+    data_test = np.ascontiguousarray(data_test, dtype=float).reshape(-1)
+    data0 = np.ascontiguousarray(data0, dtype=float).reshape(-1)
+    if np.size(weights) > 1:
+        weights = np.ascontiguousarray(weights, dtype=float).reshape(-1)
+    else:
+        weights = np.full(len(data_test), np.asarray(weights, dtype=float).item())
+    obj_value, npoints = _get_residual_kernel()(
+        data_test, data0, weights, _residual_methods[method]
+    )
+
+    if len(data_test) != npoints:
+        tmp = 1 - npoints / len(data_test)
+        if tmp > nan_ratio:
+            obj_value += (len(data_test) - npoints) * nan_number
+            logger.debug(
+                "Values of NaN were removed from objective value calculation, nan_ratio {} > {}, augment obj. value".format(
+                    tmp, nan_ratio
+                )
+            )
+        else:
+            logger.debug(
+                "Values of NaN were removed from objective value calculation, nan_ratio {} < {}".format(
+                    tmp, nan_ratio
+                )
+            )
+
+    return obj_value
@@ -0,0 +1,267 @@
+"""
+Unit and regression test for the functions used to compute the objective of parameter fitting.
+"""
+
+# Import package, test suite, and other packages as needed
+import despasito.parameter_fitting.fit_functions as ff
+import despasito.parameter_fitting.global_methods as gm
+from despasito.parameter_fitting.interface import ExpDataTemplate, refresh_batch
+import pytest
+import numpy as np
+
+
+class StubEos:
+    """ Equation of state object that records the parameters it's given """
+
+    def __init__(self):
+        self.parameters = {}
+
+    def update_parameter(self, param_name, bead_names, param_value):
+        self.parameters[(param_name, tuple(bead_names))] = param_value
+
+
+class CountingEos(StubEos):
+    """ Equation of state object that counts parameter updates and refreshes """
+
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+        self.nrefresh = 0
+        self.fail_refresh = False
+
+    def update_parameters(self, updates):
+        self.updates.append(list(updates))
+        for param_name, bead_names, param_value in updates:
+            self.update_parameter(param_name, bead_names, param_value)
+
+    def parameter_refresh(self):
+        if self.fail_refresh:
+            raise ValueError("Refresh failed")
+        self.nrefresh += 1
+
+
+class StubData(ExpDataTemplate):
+    """ Data set with an objective and gradient that are independent of the Eos """
+
+    def __init__(self, data_dict, obj_value=1.0, gradient=None):
+        super().__init__(data_dict)
+        self.name = "stub"
+        self.result_keys = []
+        self.obj_value = obj_value
+        self.grad_value = gradient
+
+    def objective(self):
+        self.nobjective = getattr(self, "nobjective", 0) + 1
+        return self.obj_value
+
+
+class StubGradientData(StubData):
+    """ Data set that provides a known gradient """
+
+    def gradient(self):
+        return np.array(self.grad_value, dtype=float)
+
+
+fit_bead = "CH3"
+fit_parameter_names = ["epsilon", "sigma"]
+bounds = [(200.0, 400.0), (0.3, 0.5)]
+
+
+def test_provides_gradient():
+
+    Eos = StubEos()
+    exp_dict = {
+        "one": StubGradientData({"eos_obj": Eos}, gradient=[1.0, 2.0]),
+        "two": StubData({"eos_obj": Eos}),
+    }
+    assert not ff.provides_gradient(exp_dict)
+    del exp_dict["two"]
+    assert ff.provides_gradient(exp_dict)
+    assert not ff.provides_gradient({})
+
+
+def test_compute_gradient_sum():
+
+    Eos = StubEos()
+    exp_dict = {
+        "one": StubGradientData({"eos_obj": Eos}, gradient=[1.0, 2.0]),
+        "two": StubGradientData({"eos_obj": Eos}, gradient=[3.0, -5.0]),
+    }
+    gradient = ff.compute_gradient(
+        np.array([300.0, 0.4]), fit_bead, fit_parameter_names, exp_dict, bounds
+    )
+    assert gradient == pytest.approx(np.array([4.0, -3.0]))
+    assert Eos.parameters == {("epsilon", ("CH3",)): 300.0, ("sigma", ("CH3",)): 0.4}
+
+
+def test_compute_gradient_frozen():
+
+    exp_dict = {
+        "one": StubGradientData({"eos_obj": StubEos()}, gradient=[1.0, 2.0]),
+    }
+    gradient = ff.compute_gradient(
+        np.array([0.4]),
+        fit_bead,
+        fit_parameter_names,
+        exp_dict,
+        bounds,
+        frozen_parameters=np.array([300.0]),
+    )
+    assert gradient == pytest.approx(np.array([2.0]))
+
+
+def test_compute_gradient_penalty():
+
+    exp_dict = {
+        "one": StubGradientData({"eos_obj": StubEos()}, gradient=[1.0, 2.0]),
+    }
+    dx = 2e-3
+    gradient = ff.compute_gradient(
+        np.array([bounds[0][0] - dx, bounds[1][1] + dx]),
+        fit_bead,
+        fit_parameter_names,
+        exp_dict,
+        bounds,
+    )
+    assert gradient == pytest.approx(
+        np.array([1.0 + 8e3 * (-1e3 * dx) ** 7, 2.0 + 8e3 * (1e3 * dx) ** 7])
+    )
+
+
+def test_basinhopping_jac(monkeypatch):
+
+    kwargs = {}
+
+    def basinhopping(func, x0, **opts):
+        kwargs.update(opts["minimizer_kwargs"])
+
+    monkeypatch.setattr(gm.spo, "basinhopping", basinhopping)
+    Eos = StubEos()
+    exp_dict = {"one": StubGradientData({"eos_obj": Eos}, gradient=[1.0, 2.0])}
+    gm.basinhopping(
+        np.array([300.0, 0.4]), bounds, fit_bead, fit_parameter_names, exp_dict
+    )
+    assert kwargs["jac"] is ff.compute_gradient
+    assert kwargs["method"] == "CG"
+    assert kwargs["args"] == (fit_bead, fit_parameter_names, exp_dict, bounds)
+
+    # A chosen method is kept
+    kwargs.clear()
+    gm.basinhopping(
+        np.array([300.0, 0.4]),
+        bounds,
+        fit_bead,
+        fit_parameter_names,
+        exp_dict,
+        minimizer_opts={"method": "BFGS"},
+    )
+    assert kwargs["jac"] is ff.compute_gradient
+    assert kwargs["method"] == "BFGS"
+
+    # Without a gradient from every data set, jac isn't provided
+    kwargs.clear()
+    exp_dict["two"] = StubData({"eos_obj": Eos})
+    gm.basinhopping(
+        np.array([300.0, 0.4]), bounds, fit_bead, fit_parameter_names, exp_dict
+    )
+    assert "jac" not in kwargs
+    assert kwargs["method"] == "nelder-mead"
+
+
+def test_refresh_batch_shared_eos():
+
+    Eos = CountingEos()
+    exp_dict = {
+        "one": StubData({"eos_obj": Eos}, obj_value=1.0),
+        "two": StubData({"eos_obj": Eos}, obj_value=2.0),
+    }
+    obj_value = ff.compute_obj(
+        np.array([300.0, 0.4]), fit_bead, fit_parameter_names, exp_dict, bounds
+    )
+    assert obj_value == pytest.approx(3.0)
+    assert Eos.nrefresh == 1
+    assert Eos.parameters == {("epsilon", ("CH3",)): 300.0, ("sigma", ("CH3",)): 0.4}
+
+
+def test_refresh_batch_nested():
+
+    Eos = CountingEos()
+    data_one = StubData({"eos_obj": Eos})
+    data_two = StubData({"eos_obj": Eos})
+    with refresh_batch():
+        with refresh_batch():
+            data_one.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+        assert Eos.nrefresh == 0
+        data_two.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+        assert Eos.nrefresh == 0
+    assert Eos.nrefresh == 1
+
+    # Outside of a batch, the refresh is immediate
+    data_one.update_parameters(fit_bead, fit_parameter_names, [310.0, 0.4])
+    assert Eos.nrefresh == 2
+
+
+def test_refresh_batch_failure():
+
+    Eos = CountingEos()
+    data_one = StubData({"eos_obj": Eos})
+    data_two = StubData({"eos_obj": Eos})
+    Eos.fail_refresh = True
+    with pytest.raises(ValueError, match="Refresh failed"):
+        with refresh_batch():
+            data_one.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+            data_two.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+    assert data_one._last_param_cache == {}
+    assert data_two._last_param_cache == {}
+
+    # The same parameters are pushed again after a failed refresh
+    Eos.fail_refresh = False
+    nupdates = len(Eos.updates)
+    with refresh_batch():
+        data_one.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+    assert len(Eos.updates) == nupdates + 1
+    assert Eos.nrefresh == 1
+
+
+def test_update_parameters_changed():
+
+    Eos = CountingEos()
+    data_set = StubData({"eos_obj": Eos})
+    data_set.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+    assert Eos.updates == [
+        [("epsilon", ("CH3",), 300.0), ("sigma", ("CH3",), 0.4)]
+    ]
+    assert Eos.nrefresh == 1
+
+    # Unchanged values are neither pushed nor refreshed
+    data_set.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+    assert len(Eos.updates) == 1
+    assert Eos.nrefresh == 1
+
+    # Only the changed value is pushed
+    data_set.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.45])
+    assert Eos.updates[-1] == [("sigma", ("CH3",), 0.45)]
+    assert Eos.nrefresh == 2
+
+    # New parameter names push every value
+    data_set.update_parameters(fit_bead, ["epsilon"], [300.0])
+    assert Eos.updates[-1] == [("epsilon", ("CH3",), 300.0)]
+
+
+def test_objective_cached():
+
+    Eos = CountingEos()
+    data_set = StubData({"eos_obj": Eos}, obj_value=2.0)
+    data_set.update_parameters(fit_bead, fit_parameter_names, [300.0, 0.4])
+    assert data_set.objective_cached([300.0, 0.4]) == 2.0
+    assert data_set.objective_cached([300.0, 0.4]) == 2.0
+    assert data_set.nobjective == 1
+
+    data_set.update_parameters(fit_bead, fit_parameter_names, [310.0, 0.4])
+    assert data_set.objective_cached([310.0, 0.4]) == 2.0
+    assert data_set.nobjective == 2
+
+    # The precision of the Eos object is part of the key
+    Eos.eos_dtype = np.float32
+    assert data_set.objective_cached([310.0, 0.4]) == 2.0
+    assert data_set.nobjective == 3
@@ -177,3 +177,134 @@ def test_saturation_de(Eos=Eos, thermo_dict=thermo_dict0.copy()):
     assert output["parameters_final"][0] == pytest.approx(375.01, abs=1.0) and output[
         "objective_value"
     ] == pytest.approx(5.7658, abs=0.01)
+
+
+def test_data_dict_reuse(Eos=Eos):
+    #   """Test that several data sets may be built from the same data_dict"""
+    from despasito.parameter_fitting.data_classes import liquid_density
+
+    weights = {"rhol": 2.0}
+    density_opts = {"density_increment": 5.0}
+    data_dict = {
+        "eos_obj": Eos,
+        "weights": weights,
+        "density_opts": density_opts,
+        "objective_method": "sum-squared-deviation",
+        "T": np.array([298.15, 310.0]),
+        "P": np.array([101325.0, 101325.0]),
+        "rhol": np.array([24000.0, 23500.0]),
+    }
+    reference = {key: value for key, value in data_dict.items()}
+
+    data_sets = [liquid_density.Data(data_dict) for _ in range(2)]
+
+    assert data_dict.keys() == reference.keys()
+    for key, value in reference.items():
+        assert data_dict[key] is value
+    assert weights == {"rhol": 2.0}
+    assert density_opts == {"density_increment": 5.0}
+    assert data_dict["T"] == pytest.approx(np.array([298.15, 310.0]))
+    for data_set in data_sets:
+        assert data_set.weights is not weights
+        assert data_set.weights["rhol"] == pytest.approx(np.array([2.0, 2.0]))
+        assert data_set.obj_opts.method == "sum-squared-deviation"
+        assert data_set.thermodict["Tlist"] == pytest.approx(data_dict["T"])
+        assert data_set.thermodict["density_opts"]["density_increment"] == 5.0
+
+
+## Associating EOS Object for reduced precision
+bead_library_h2o = {
+    "H2O": {
+        "epsilon": 266.68,
+        "lambdaa": 6.0,
+        "lambdar": 17.02,
+        "sigma": 3.0063e-1,
+        "Sk": 1.0,
+        "Vks": 1,
+        "mass": 0.018015,
+        "Nk-H": 2,
+        "Nk-e1": 2,
+        "epsilonHB-H-e1": 1985.4,
+        "K-H-e1": 1.0169e-1,
+    }
+}
+Eos_assoc = despasito.equations_of_state.initiate_eos(
+    eos="saft.gamma_mie",
+    beads=["H2O"],
+    molecular_composition=np.array([[1.0]]),
+    bead_library=bead_library_h2o,
+    numba=True,
+)
+
+
+def thermo_dict_assoc(
+    global_opts={"method": "single_objective"}, parameters_guess=[270.0]
+):
+    # New inputs for each fit of the same Eos object
+    thermo_dict = {
+        "optimization_parameters": {
+            "fit_bead": "H2O",
+            "fit_parameter_names": ["epsilon"],
+            "epsilon_bounds": [200.0, 300.0],
+        },
+        "parameters_guess": list(parameters_guess),
+        "global_opts": dict(global_opts),
+        "exp_data": {
+            "density": {
+                "data_class_type": "liquid_density",
+                "eos_obj": Eos_assoc,
+                "calculation_type": "liquid_properties",
+                "T": np.array([298.15]),
+                "P": np.array([101325.0]),
+                "rhol": np.array([55342.0]),
+            }
+        },
+    }
+    return ri.process_param_fit_inputs(thermo_dict)
+
+
+def test_reduced_precision(monkeypatch):
+
+    compute_obj = fit.ff.compute_obj
+    dtypes = []
+
+    def wrapper(*args, **kwargs):
+        dtypes.append(Eos_assoc.eos_dtype)
+        return compute_obj(*args, **kwargs)
+
+    monkeypatch.setattr(fit.ff, "compute_obj", wrapper)
+    global_opts = {
+        "method": "differential_evolution",
+        "maxiter": 2,
+        "popsize": 3,
+        "polish": False,
+        "seed": 0,
+    }
+    output = fit.fit(**thermo_dict_assoc(global_opts), reduced_precision=True)
+
+    # The minimization iterates in single precision, then the result is evaluated in double precision
+    assert len(dtypes) > 2
+    assert all(dtype is np.float32 for dtype in dtypes[:-1])
+    assert dtypes[-1] is np.float64
+    assert Eos_assoc.eos_dtype is np.float64
+
+    monkeypatch.setattr(fit.ff, "compute_obj", compute_obj)
+    output_ref = fit.fit(
+        **thermo_dict_assoc(parameters_guess=output["parameters_final"])
+    )
+    assert output["objective_value"] == pytest.approx(
+        output_ref["objective_value"], rel=1e-10
+    )
+
+
+def test_reduced_precision_restore(monkeypatch):
+
+    def failed_minimization(*args, **kwargs):
+        raise ValueError("Minimization failed")
+
+    monkeypatch.setattr(fit.ff, "global_minimization", failed_minimization)
+    monkeypatch.setattr(Eos_assoc, "eos_dtype", np.float32)
+    with pytest.raises(TypeError, match="parameter fitting failed"):
+        fit.fit(**thermo_dict_assoc(), reduced_precision=True)
+
+    assert Eos_assoc.eos_dtype is np.float32
@@ -74,3 +74,32 @@ def test_peng_robinson_class_assoc_mu(P=P, xi=xi, T=T, Eos=Eos, rho=rho):
     phi = Eos.fugacity_coefficient(P, rho, xi, T)
     #    assert mui == pytest.approx(np.array([1.61884825, -4.09022886]),abs=1e-4)
     assert phi == pytest.approx(np.array([1.12643785, 0.55712584]), abs=1e-4)
+
+
+class CheckedEosType(despasito.equations_of_state.cubic.peng_robinson.EosType):
+    """ Peng-Robinson Eos that rejects negative parameter values """
+
+    def update_parameter(self, param_name, bead_names, param_value):
+        self.nupdates = getattr(self, "nupdates", 0) + 1
+        if param_value < 0.0:
+            raise ValueError("Parameter values must be positive")
+        super().update_parameter(param_name, bead_names, param_value)
+
+
+def test_update_parameters_override():
+    #   """Test that update_parameters uses an overridden update_parameter"""
+    Eos_checked = CheckedEosType(
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library={key: value.copy() for key, value in bead_library.items()},
+    )
+    Eos_checked.update_parameters(
+        [("Tc", ("acetone",), 510.0), ("kij", ("acetone", "chloroform"), 0.05)]
+    )
+    assert Eos_checked.nupdates == 2
+    assert Eos_checked.bead_library["acetone"]["Tc"] == 510.0
+    assert Eos_checked.cross_library["acetone"]["chloroform"]["kij"] == 0.05
+
+    with pytest.raises(ValueError, match="must be positive"):
+        Eos_checked.update_parameters([("Tc", ("acetone",), -2.0)])
+    assert Eos_checked.bead_library["acetone"]["Tc"] == 510.0
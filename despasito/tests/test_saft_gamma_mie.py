@@ -210,6 +210,43 @@ def test_saft_gamma_mie_class_assoc_fugacity_coeff(
     phi = Eos_class.fugacity_coefficient(P, rho, xi, T)
     assert phi == pytest.approx(np.array([0.48972481, 0.00281112]), abs=1e-4)
 
+
+def test_saft_gamma_mie_parameter_refresh_assoc(
+    T=T,
+    xi=xi_co2_h2o,
+    rho=rho_co2_h2o,
+    beads=beads_co2_h2o,
+    molecular_composition=molecular_composition_co2_h2o,
+    bead_library=bead_library_co2_h2o,
+    cross_library=cross_library_co2_h2o,
+):
+    #   """Test that temperature dependent association parameters are recomputed after a parameter refresh at the same temperature"""
+    Eos_class = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_mie",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(bead_library),
+        cross_library=copy.deepcopy(cross_library),
+    )
+    Aassoc_old = Eos_class.Aassoc(rho, T, xi)
+
+    Eos_class.update_parameter("epsilonHB-H-e1", ["H2O"], 2300.0)
+    Eos_class.parameter_refresh()
+    Aassoc_new = Eos_class.Aassoc(rho, T, xi)
+
+    Eos_ref = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_mie",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(Eos_class.bead_library),
+        cross_library=copy.deepcopy(Eos_class.cross_library),
+    )
+    Aassoc_ref = Eos_ref.Aassoc(rho, T, xi)
+
+    assert Aassoc_new != pytest.approx(Aassoc_old, rel=1e-3)
+    assert Aassoc_new == pytest.approx(Aassoc_ref, rel=1e-10)
+
+
 def test_numba_available():
 
     try:
@@ -232,6 +269,67 @@ def test_numba_available():
 
     assert flag
 
+def test_numba_Xika_parallel(
+    beads=beads_co2_h2o,
+    molecular_composition=molecular_composition_co2_h2o,
+    bead_library=bead_library_co2_h2o,
+    cross_library=cross_library_co2_h2o,
+):
+    #   """Test that threaded solution of Xika for long density arrays matches pure python"""
+    from despasito.equations_of_state.saft.compiled_modules import (
+        ext_Aassoc_numba,
+        ext_Aassoc_python,
+    )
+
+    Eos = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_mie",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(bead_library),
+        cross_library=copy.deepcopy(cross_library),
+        numba=True
+    )
+    rho = np.linspace(1.0, 30000.0, ext_Aassoc_numba.parallel_threshold)
+    xi = np.array([0.5, 0.5])
+    Fklab = np.exp(Eos.eos_dict["epsilonHB"] / T) - 1.0
+    gr_assoc = Eos.saft_source.calc_gr_assoc(rho, T, xi, Ktype="klab")
+    args = (
+        Eos.eos_dict["assoc_site_indices"],
+        rho,
+        xi,
+        Eos.eos_dict["molecular_composition"],
+        Eos.eos_dict["nk"],
+        Fklab,
+        Eos.eos_dict["Kklab"],
+        gr_assoc,
+    )
+    Xika_numba, _ = ext_Aassoc_numba.calc_Xika(*args)
+    Xika_python, _ = ext_Aassoc_python.calc_Xika(*args)
+
+    assert Xika_numba == pytest.approx(Xika_python, abs=1e-10)
+
+def test_saft_gamma_mie_class_assoc_P_float32(
+    T=T,
+    xi=xi_co2_h2o,
+    rho=rho_co2_h2o,
+    beads=beads_co2_h2o,
+    molecular_composition=molecular_composition_co2_h2o,
+    bead_library=bead_library_co2_h2o,
+    cross_library=cross_library_co2_h2o,
+):
+#   """Test ability to predict P with association sites in single precision"""
+    Eos = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_mie",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(bead_library),
+        cross_library=copy.deepcopy(cross_library),
+        numba=True,
+        eos_dtype=np.float32,
+    )
+    P = Eos.pressure(np.array([rho]), T, xi)[0]
+    assert P == pytest.approx(15727391.586407745, rel=1e-3)
+
 def test_saft_gamma_mie_class_assoc_P_numba(
     T=T,
     xi=xi_co2_h2o,
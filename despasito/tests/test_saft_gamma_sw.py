@@ -86,3 +86,40 @@ def test_saft_gamma_sw_class_assoc_P_numba(T=T, xi=np.array([1.0]), Eos=Eos, den
     P = Eos.pressure(density, T, xi)[0]
     assert P == pytest.approx(9447510.360679299, abs=1e3)
 
+
+
+def test_saft_gamma_sw_parameter_refresh_assoc(
+    T=T,
+    xi=np.array([1.0]),
+    density=density,
+    beads=bead,
+    molecular_composition=molecular_composition,
+    bead_library=bead_library,
+):
+    #   """Test that the bonding volume from rc_klab is recomputed after a parameter refresh at the same temperature"""
+    Eos_class = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_sw",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(bead_library),
+    )
+    Aassoc_old = Eos_class.Aassoc(density, T, xi)
+
+    Eos_class.update_parameter("epsilonHB-e-H", ["H2O"], 1500.0)
+    Eos_class.update_parameter("rc-e-H", ["H2O"], 0.22)
+    Eos_class.parameter_refresh()
+    Aassoc_new = Eos_class.Aassoc(density, T, xi)
+
+    Eos_ref = despasito.equations_of_state.initiate_eos(
+        eos="saft.gamma_sw",
+        beads=beads,
+        molecular_composition=molecular_composition,
+        bead_library=copy.deepcopy(Eos_class.bead_library),
+    )
+    Aassoc_ref = Eos_ref.Aassoc(density, T, xi)
+
+    assert Eos_class.eos_dict["Kijklab"] == pytest.approx(
+        Eos_ref.eos_dict["Kijklab"], rel=1e-10
+    )
+    assert Aassoc_new != pytest.approx(Aassoc_old, rel=1e-3)
+    assert Aassoc_new == pytest.approx(Aassoc_ref, rel=1e-10)
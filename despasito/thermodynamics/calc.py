@@ -1192,7 +1192,7 @@ def calc_Prange_xi(
             p, T, xi, Eos, density_opts=density_opts
         )
 
-        if any(np.isnan(phil)):
+        if np.isnan(phil).any():
             logger.error("Estimated minimum pressure is too high.")
             flag_max = True
             flag_liquid = True
@@ -1447,7 +1447,7 @@ def calc_Prange_xi(
             p, T, xi, Eos, density_opts=density_opts
         )
 
-        if any(np.isnan(phil)):
+        if np.isnan(phil).any():
             logger.info(
                 "Liquid fugacity coefficient should not be NaN, pressure could be too high."
             )
@@ -1813,7 +1813,7 @@ def calc_Prange_yi(
         phiv, _, flagv = calc_vapor_fugacity_coefficient(
             p, T, yi, Eos, density_opts=density_opts
         )
-        if any(np.isnan(phiv)):
+        if np.isnan(phiv).any():
             logger.error("Estimated minimum pressure is too high.")
             flag_max = True
             ObjRange[1] = np.inf
@@ -2294,10 +2294,10 @@ def calc_vapor_composition(
         )
 
         if (
-            any(np.isnan(phiv)) or flagv == 1
+            np.isnan(phiv).any() or flagv == 1
         ) and flag_check_vapor:  # If vapor density doesn't exist
             flag_check_vapor = False
-            if all(yi_tmp != 0.0) and len(yi_tmp) == 2:
+            if (yi_tmp != 0.0).all() and len(yi_tmp) == 2:
                 logger.debug("    Composition doesn't produce a vapor, let's find one!")
                 yi_tmp = find_new_yi(
                     P, T, phil, xi, Eos, density_opts=density_opts, **kwargs
@@ -2319,7 +2319,7 @@ def calc_vapor_composition(
                 yinew = yi
         elif np.sum(np.abs(xi - yi_tmp) / xi) < tol_trivial and flag_trivial_sol:
             flag_trivial_sol = False
-            if all(yi_tmp != 0.0) and len(yi_tmp) == 2:
+            if (yi_tmp != 0.0).all() and len(yi_tmp) == 2:
                 logger.debug(
                     "    Composition produces trivial solution, let's find a different one!"
                 )
@@ -2352,7 +2352,7 @@ def calc_vapor_composition(
             P, T, yi2, Eos, density_opts=density_opts
         )
 
-        if any(np.isnan(phiv)):
+        if np.isnan(phiv).any():
             phiv = np.nan
             logger.error(
                 "Fugacity coefficient of vapor should not be NaN, pressure could be too high."
@@ -2531,9 +2531,9 @@ def calc_liquid_composition(
             P, T, xi_tmp, Eos, density_opts=density_opts
         )
 
-        if (any(np.isnan(phil)) or flagl in [0, 4]) and flag_check_liquid:
+        if (np.isnan(phil).any() or flagl in [0, 4]) and flag_check_liquid:
             flag_check_liquid = False
-            if all(xi_tmp != 0.0) and len(xi_tmp) == 2:
+            if (xi_tmp != 0.0).all() and len(xi_tmp) == 2:
                 logger.debug(
                     "    Composition doesn't produce a liquid, let's find one!"
                 )
@@ -2557,7 +2557,7 @@ def calc_liquid_composition(
                 xinew = xi
         elif np.sum(np.abs(yi - xi_tmp) / yi) < tol_trivial and flag_trivial_sol:
             flag_trivial_sol = False
-            if all(xi_tmp != 0.0) and len(xi_tmp) == 2:
+            if (xi_tmp != 0.0).all() and len(xi_tmp) == 2:
                 logger.debug(
                     "    Composition produces trivial solution, let's find a different one!"
                 )
@@ -3362,7 +3362,7 @@ def calc_dew_pressure(
         P = Pguess
 
     # Estimate initial xi
-    if "_xi_global" not in globals() or any(np.isnan(_xi_global)):
+    if "_xi_global" not in globals() or np.isnan(_xi_global).any():
         _xi_global = P * (yi / Psat)
         _xi_global /= np.sum(_xi_global)
         _xi_global = copy.deepcopy(_xi_global)
@@ -3520,7 +3520,7 @@ def calc_bubble_pressure(
     else:
         P = Pguess
 
-    if "_yi_global" not in globals() or any(np.isnan(_yi_global)):
+    if "_yi_global" not in globals() or np.isnan(_yi_global).any():
         _yi_global = xi * Psat / P
         _yi_global /= np.nansum(_yi_global)
         _yi_global = copy.deepcopy(_yi_global)
@@ -3649,7 +3649,7 @@ def hildebrand_solubility(
     vlist, Plist = pressure_vs_volume_arrays(
         T, xi, Eos, **density_opts, max_density=rhol
     )
-    if any(vlist != vlist2):
+    if np.any(vlist != vlist2):
         logger.error("Dependant variable vectors must be identical.")
 
     int_tmp = (Plist2 - Plist1) / (2 * dT) / R - Plist / (RT)
@@ -3776,7 +3776,7 @@ def calc_flash(
         # Mole Fraction
         xi[0] = (1 - Ki[1]) / (Ki[0] - Ki[1])
         xi[1] = 1 - xi[0]
-        if any(xi < 0.0):
+        if (xi < 0.0).any():
             ind = np.where(xi < 0.0)[0][0]
             xi[ind] = np.sqrt(np.finfo(float).eps)
             if ind == 0:
@@ -288,17 +288,13 @@ def central_difference(x, func, step_size=1e-5, relative=False, args=()):
     """
 
     if not isiterable(x):
-        x - np.array([x])
+        x = np.array([x])
     elif not isinstance(x, np.ndarray):
         x = np.array(x)
 
     if relative:
         step = x * step_size
-        if not isiterable(step):
-            step = np.array([step])
-        step = np.array(
-            [2 * np.finfo(float).eps if xx < np.finfo(float).eps else xx for xx in step]
-        )
+        step = np.where(step < np.finfo(float).eps, 2 * np.finfo(float).eps, step)
     else:
         step = step_size
 